@@ -1,12 +1,53 @@
 """Centralized configuration using pydantic-settings"""
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, Literal, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    import psutil
+except ImportError:  # Optional, /proc/meminfo is read otherwise
+    psutil = None
+
+from app.core.constants import (
+    BROWSER_PAGE_MEMORY_MB,
+    DEFAULT_MAX_CONCURRENT,
+    MAX_CONCURRENT_LIMIT,
+    PAGES_PER_WORKER,
+)
+
+
+def _available_memory_mb() -> Optional[int]:
+    """Available physical memory in MB, or None if the platform doesn't say.
+
+    Uses MemAvailable, which unlike MemFree counts reclaimable page cache.
+    """
+    if psutil is not None:
+        return psutil.virtual_memory().available // (1024 * 1024)
+
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def auto_max_concurrent() -> int:
+    """Size scraper workers from CPU count and available memory."""
+    cpus = os.cpu_count()
+    memory_mb = _available_memory_mb()
+    if cpus is None or memory_mb is None:
+        return DEFAULT_MAX_CONCURRENT
+    workers = min(cpus, memory_mb // (BROWSER_PAGE_MEMORY_MB * PAGES_PER_WORKER))
+    return max(1, min(workers, MAX_CONCURRENT_LIMIT))
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
@@ -30,7 +71,10 @@ class Settings(BaseSettings):
 
     # Anti-ban configuration
     max_concurrent: int = Field(
-        default=2, ge=1, le=5, description="Max concurrent items to process"
+        default=DEFAULT_MAX_CONCURRENT,
+        ge=1,
+        le=MAX_CONCURRENT_LIMIT,
+        description='Max concurrent items to process ("auto" sizes it to the host)',
     )
     delay_between_items: int = Field(
         default=1000, ge=0, description="Fixed delay between items (ms)"
@@ -67,10 +111,22 @@ class Settings(BaseSettings):
     # Output
     save_screenshot: bool = Field(default=True)
     save_html: bool = Field(default=True)
-    save_debug_info: bool = Field(default=True, description="Save debug files")
+    screenshot_format: Literal["jpeg", "png"] = Field(
+        default="jpeg", description="Debug screenshot format"
+    )
+    save_debug_info: bool = Field(default=False, description="Save debug files")
     output_directory: Path = Field(default=Path("data"))
     output_dir: str = Field(default="data", description="Output directory path")
 
+    # Cache
+    cache_enabled: bool = Field(
+        default=True, description="Reuse recent detailed results for repeated items"
+    )
+    cache_ttl_hours: float = Field(
+        default=6.0, gt=0, description="Detailed results cache TTL (hours)"
+    )
+    cache_dir: str = Field(default=".cache", description="Cache directory path")
+
     # Scraping URL
     target_url: str = Field(
         default="https://steamdt.com/en/hanging",
@@ -90,6 +146,14 @@ class Settings(BaseSettings):
     gemini_api_key: Optional[str] = Field(default=None, description="Gemini API key")
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
 
+    @field_validator("max_concurrent", mode="before")
+    @classmethod
+    def resolve_auto_concurrency(cls, v):
+        """Replace "auto" with a worker count sized to CPU and memory"""
+        if isinstance(v, str) and v.strip().lower() == "auto":
+            return auto_max_concurrent()
+        return v
+
     @field_validator("random_delay_max")
     @classmethod
     def validate_random_delays(cls, v: int, info) -> int:
@@ -153,12 +217,21 @@ class Settings(BaseSettings):
             output = config_data["output"]
             flat_config["save_screenshot"] = output.get("save_screenshot", True)
             flat_config["save_html"] = output.get("save_html", True)
+            flat_config["screenshot_format"] = output.get("screenshot_format", "jpeg")
             flat_config["output_directory"] = Path(
                 output.get("output_directory", "data")
             )
 
+        if "cache" in config_data:
+            cache = config_data["cache"]
+            flat_config["cache_enabled"] = cache.get("enabled", True)
+            flat_config["cache_ttl_hours"] = cache.get("ttl_hours", 6.0)
+            flat_config["cache_dir"] = cache.get("directory", ".cache")
+
         if "debug" in config_data:
-            flat_config["log_level"] = config_data["debug"].get("log_level", "INFO")
+            debug = config_data["debug"]
+            flat_config["log_level"] = debug.get("log_level", "INFO")
+            flat_config["save_debug_info"] = debug.get("save_debug_info", False)
 
         return cls(**flat_config)
 
@@ -7,6 +7,7 @@ Centralized magic numbers and configuration values.
 STEAM_MAX_LISTINGS = 5  # Maximum Steam listings to extract for average price
 BUFF_MAX_SELLING_ITEMS = 25  # Maximum BUFF selling items to extract
 BUFF_MAX_TRADE_RECORDS = 25  # Maximum BUFF trade history records
+BUFF_PRICE_SAMPLE_SIZE = 5  # Cheapest BUFF listings/latest trades averaged
 
 # Price validation
 PRICE_DROP_THRESHOLD_PERCENT = (
@@ -28,12 +29,52 @@ STEAM_NAVIGATION_TIMEOUT = 10000  # Steam page navigation timeout
 BUFF_RETRY_TIMEOUT = 30000  # BUFF retry navigation timeout
 PAGE_WAIT_DYNAMIC_CONTENT = 2000  # Wait for dynamic content to load
 BLANK_PAGE_RESET_WAIT = 2000  # Wait after navigating to about:blank
+TARGET_NAVIGATION_TIMEOUT = 30000  # SteamDT page navigation timeout
+DEFAULT_NAVIGATION_TIMEOUT = 15000  # Default navigation timeout for the main page
+
+# Steam HTTP fast path (market listings render endpoint)
+STEAM_RENDER_CURRENCY = 3  # Steam currency code requested for prices (EUR)
+STEAM_EUR_CURRENCY_ID = 2003  # Currency id Steam reports for EUR amounts
+HTTP_CLIENT_TIMEOUT = 15.0  # Shared HTTP client timeout (seconds)
+HTTP_MAX_CONNECTIONS = 20  # Shared HTTP client connection pool size
+HTTP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Hosts every item hits; warmed while the producer reads the listing table.
+# Order matches a worker page pair: (BUFF page, Steam page)
+WARM_UP_URLS = (
+    "https://buff.163.com/robots.txt",
+    "https://steamcommunity.com/robots.txt",
+)
+WARM_UP_TIMEOUT = 5000  # Per-host warm-up request timeout
+
+# Per-host request pacing shared by all workers (requests per second)
+HOST_RATE_LIMITS = {
+    "buff.163.com": 3.0,
+    "steamcommunity.com": 1.0,  # Steam Market throttles listing requests hard
+}
+AUTOTHROTTLE_TARGET_CONCURRENCY = 2.0  # Requests in flight per host at steady state
+AUTOTHROTTLE_MAX_INTERVAL = 10.0  # Upper bound on adaptive spacing (seconds)
+
+# Live CNY/EUR rate (falls back to rules.CNY_TO_EUR when unavailable)
+EXCHANGE_RATE_URL = "https://open.er-api.com/v6/latest/EUR"
+EXCHANGE_RATE_TTL_HOURS = 1  # Refetch the rate at most once per hour
+
+# Concurrency auto-sizing ("max_concurrent": "auto")
+MAX_CONCURRENT_LIMIT = 5  # Anti-ban ceiling for concurrent scraper workers
+DEFAULT_MAX_CONCURRENT = 2  # Worker count when the host can't be sized
+BROWSER_PAGE_MEMORY_MB = 400  # Estimated memory per Chromium page
+PAGES_PER_WORKER = 2  # Each scraper worker keeps a BUFF and a Steam page
+
+# Caching
+URL_CACHE_TTL_HOURS = 24 * 7  # SteamDT item page -> BUFF/Steam URLs
 
 # Batch processing
 STORAGE_BATCH_SIZE = 10  # Number of items to batch before DB insert
 
 # Filter configuration delays (ms) - Optimized for speed
 FILTER_MODAL_CLOSE_WAIT = 500  # Wait after closing modal
+FILTER_MODAL_APPEAR_TIMEOUT = 500  # Max wait for the initial modal to show up
+FILTER_MODAL_HIDE_TIMEOUT = 2000  # Max wait for the modal to go away after closing
 FILTER_CURRENCY_INITIAL_WAIT = 500  # Wait before opening currency dropdown
 FILTER_DROPDOWN_OPEN_WAIT = 300  # Wait after opening dropdown
 FILTER_CURRENCY_RELOAD_WAIT = 1000  # Wait for prices to reload after currency change
@@ -41,7 +82,26 @@ FILTER_TAB_SWITCH_WAIT = 300  # Wait after switching tabs
 FILTER_INPUT_READY_WAIT = 300  # Wait for filter inputs to be ready
 FILTER_PLATFORM_OPEN_WAIT = 500  # Wait after opening platform settings
 FILTER_SEARCH_EXECUTE_WAIT = 2000  # Wait after executing search
+FILTER_UI_TIMEOUT = 2000  # Max wait for a filter control to appear or react
 
 # Item extraction
+TARGET_READY_SELECTOR = ".el-table, .el-dropdown-link"  # SteamDT page is usable
 ITEM_TABLE_LOAD_TIMEOUT = 10000  # Max time to wait for table to appear
 ITEM_TABLE_FALLBACK_WAIT = 2000  # Fallback wait if selector times out
+
+# Debug output
+SCREENSHOT_JPEG_QUALITY = 70  # Debug screenshots only, PNG encoding is far slower
+
+# Request blocking - resources the scraper never inspects
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+WORKER_BLOCKED_RESOURCE_TYPES = frozenset({"stylesheet"})  # BUFF/Steam pages only
+BLOCKED_URL_KEYWORDS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "hm.baidu.com",
+    "cnzz.com",
+)
@@ -1,11 +1,13 @@
 """Structured JSON logging without emojis with rotating file handlers"""
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueListener, RotatingFileHandler
 
 import structlog
 from structlog.processors import JSONRenderer
@@ -13,6 +15,70 @@ from structlog.stdlib import add_log_level, filter_by_level
 
 from app.core.config import settings
 
+# Separator line for the legacy scraping log helpers
+LOG_SEPARATOR = "=" * 80
+
+# Rendered and written by a background listener so log calls never block on I/O
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+
+
+class EventDictFormatter(logging.Formatter):
+    """Render the structlog event dict carried by a queued record."""
+
+    def __init__(self, colors: bool):
+        super().__init__()
+        self.renderer = structlog.dev.ConsoleRenderer(colors=colors, pad_event=30)
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.renderer(None, record.method_name, dict(record.event_dict))
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that renders each record once instead of twice.
+
+    The stdlib size check formats the record and emit() then formats it
+    again; the check here keeps the rendered message for emit() to reuse.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending: Optional[tuple] = None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+
+        msg = self.format(record)
+        self._pending = (record, msg)
+        if self.stream.tell() + len(msg) + 1 < self.maxBytes:
+            return False
+        # Same guard as the stdlib: never rotate special files like /dev/null
+        return Path(self.baseFilename).is_file()
+
+    def format(self, record: logging.LogRecord) -> str:
+        pending, self._pending = self._pending, None
+        if pending is not None and pending[0] is record:
+            return pending[1]
+        return super().format(record)
+
+
+def _stop_listener():
+    """Flush queued records and close the handlers of the running listener."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def add_timestamp(logger: Any, method_name: str, event_dict: Dict) -> Dict:
     """Add compact timestamp to log entries"""
@@ -47,46 +113,57 @@ def configure_logging(
     log_file = log_directory / f"scraper_{timestamp}.log"
 
     # File handler without ANSI colors
-    file_handler = RotatingFileHandler(
+    file_handler = FastRotatingFileHandler(
         log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
         encoding="utf-8",
     )
     file_handler.setLevel(getattr(logging, level))
+    file_handler.setFormatter(EventDictFormatter(colors=False))
 
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level))
+    console_handler.setFormatter(EventDictFormatter(colors=True))
+
+    # No formatter shows thread/process info, so don't collect it per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # Python 3.12+
 
     # Configure stdlib logging
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level))
     root_logger.handlers.clear()
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-
-    # Create custom renderer to route colored output to console, plain to file
-    def route_to_appropriate_handler(logger, method_name, event_dict):
-        """Route logs to appropriate handler with correct formatting."""
-        # Get the log record
-        import logging
-
-        # Format for file (plain text, no colors)
-        file_renderer = structlog.dev.ConsoleRenderer(colors=False, pad_event=30)
-        file_msg = file_renderer(logger, method_name, event_dict.copy())
 
-        # Format for console (with colors)
-        console_renderer = structlog.dev.ConsoleRenderer(colors=True, pad_event=30)
-        console_msg = console_renderer(logger, method_name, event_dict.copy())
-
-        # Log to file handler (plain)
-        file_handler.stream.write(file_msg + "\n")
-        file_handler.stream.flush()
+    # Replace the listener from a previous configure_logging call
+    global _listener
+    _stop_listener()
+    _listener = QueueListener(
+        _log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
 
-        # Log to console handler (colored)
-        console_handler.stream.write(console_msg + "\n")
-        console_handler.stream.flush()
+    # Hand the event to the listener thread, which renders plain text to the
+    # file and colored output to the console
+    def route_to_appropriate_handler(logger, method_name, event_dict):
+        """Queue the event for the file and console handlers."""
+        # add_log_level normalizes the method name ("exception" -> "error"),
+        # so handler levels filter on the real severity
+        level_name = event_dict.get("level", method_name).upper()
+        _log_queue.put_nowait(
+            logging.makeLogRecord(
+                {
+                    "name": getattr(logger, "name", ""),
+                    "levelno": getattr(logging, level_name, logging.INFO),
+                    "levelname": level_name,
+                    "method_name": method_name,
+                    "event_dict": event_dict,
+                }
+            )
+        )
 
         # Prevent stdlib logging from handling it again
         raise structlog.DropEvent
@@ -162,13 +239,16 @@ def get_scraping_summary_logger(log_dir: str = "logs") -> logging.Logger:
 
 def log_scraping_start(logger, url: str, config: dict = None):
     """Log scraping start event."""
-    logger.info("=" * 80)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info(LOG_SEPARATOR)
     logger.info("scraping_started", url=url, timestamp=datetime.now().isoformat())
 
     if config:
         logger.info("scraping_configuration", config=config)
 
-    logger.info("=" * 80)
+    logger.info(LOG_SEPARATOR)
 
 
 def log_scraping_end(
@@ -177,7 +257,7 @@ def log_scraping_end(
     """Log scraping end event."""
     status = "completed" if success else "failed"
 
-    logger.info("=" * 80)
+    logger.info(LOG_SEPARATOR)
     logger.info(
         "scraping_finished",
         status=status,
@@ -186,11 +266,15 @@ def log_scraping_end(
         duration_minutes=round(duration_seconds / 60, 2),
         timestamp=datetime.now().isoformat(),
     )
-    logger.info("=" * 80)
+    logger.info(LOG_SEPARATOR)
 
 
 def log_item_processed(logger, item_name: str, profit_eur: float, profitability: float):
     """Log individual item processing."""
+    # Skip the rounding and ROI formatting when INFO is filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info(
         "item_processed",
         item_name=item_name,
@@ -10,6 +10,7 @@ from app.domain.rules import (
     calculate_profit,
     calculate_roi,
     convert_cny_to_eur,
+    set_cny_to_eur_rate,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "calculate_profit",
     "calculate_roi",
     "convert_cny_to_eur",
+    "set_cny_to_eur_rate",
 ]
@@ -6,7 +6,13 @@ from typing import Literal
 STEAM_FEE_PERCENT = 13.0
 BUFF_FEE_PERCENT = 2.5
 
-CNY_TO_EUR = 8.2  # 1 EUR = ~8.2 CNY (December 2025)
+CNY_TO_EUR = 8.2  # 1 EUR = ~8.2 CNY (December 2025), used until a live rate is set
+
+# Current CNY per EUR rate; replaced by set_cny_to_eur_rate() with a live value
+_cny_per_eur = CNY_TO_EUR
+
+# Share of a Steam sale the seller keeps after the fee (0.87)
+STEAM_NET_RATIO = 1 - STEAM_FEE_PERCENT / 100
 
 
 def calculate_fees(
@@ -32,7 +38,7 @@ def calculate_net_price(
 
 def calculate_profit(buy_price: float, sell_price: float) -> float:
     cost_with_fees = buy_price
-    revenue_after_fees = sell_price - calculate_fees(sell_price, "steam")
+    revenue_after_fees = sell_price * STEAM_NET_RATIO
 
     return revenue_after_fees - cost_with_fees
 
@@ -42,7 +48,7 @@ def calculate_roi(buy_price: float, sell_price: float) -> float:
         return 0.0
 
     # Steam takes 13% fee, so net is 87% (0.87)
-    steam_net = sell_price * 0.87
+    steam_net = sell_price * STEAM_NET_RATIO
     roi_ratio = (steam_net / buy_price) - 1
     
     return roi_ratio * 100  # Convert to percentage
@@ -59,5 +65,12 @@ def is_profitable(
     return roi >= min_roi_percent
 
 
+def set_cny_to_eur_rate(cny_per_eur: float) -> None:
+    global _cny_per_eur
+    if cny_per_eur <= 0:
+        raise ValueError(f"Invalid CNY per EUR rate: {cny_per_eur}")
+    _cny_per_eur = cny_per_eur
+
+
 def convert_cny_to_eur(price_cny: float) -> float:
-    return price_cny / CNY_TO_EUR
+    return price_cny / _cny_per_eur
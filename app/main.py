@@ -9,11 +9,14 @@ from typing import Optional
 import click
 
 from app.core.config import settings
+from app.core.constants import MAX_CONCURRENT_LIMIT
 from app.core.logger import configure_logging, get_logger
 from app.domain.models import ScrapedItem
 from app.services.scraping import ScrapingService
 from app.services.workers import format_item_display
 from app.services.storage import StorageService
+from app.services.utils import BrowserManager
+from app.services.utils.file_saver import write_json_array
 
 # Configure logging on startup
 log_dir = Path("logs")
@@ -22,6 +25,9 @@ configure_logging(log_dir=str(log_dir))
 
 logger = get_logger(__name__)
 
+# Separator line for CLI summaries
+BANNER = "=" * 60
+
 
 async def scrape_only(
     headless: bool = True,
@@ -33,6 +39,7 @@ async def scrape_only(
     quiet: bool = False,
     async_storage: bool = False,
     storage_workers: int = 2,
+    use_cache: bool = True,
 ) -> list[ScrapedItem]:
     logger.info(
         "scrape_started",
@@ -46,19 +53,28 @@ async def scrape_only(
     # Override settings with runtime parameters (only if explicitly provided)
     # If using CLI defaults, respect JSON config
     settings.max_concurrent = max_concurrent
+    if not use_cache:
+        settings.cache_enabled = False
 
     # Initialize scraping service with settings
     scraping_service = ScrapingService(settings)
+    # Kept until the final output is written, so a failed write loses nothing
+    partial_results_file = scraping_service.file_saver.new_partial_results_file()
 
     # Run scraper (unified method with async_storage parameter)
-    items, discarded_items = await scraping_service.scrape_items(
-        limit=limit,
-        concurrent_workers=max_concurrent,
-        storage_workers=storage_workers,
-        exclusion_filters=exclude_prefixes or [],
-        async_storage=async_storage and save_to_db,
-        headless=headless,
-    )
+    try:
+        items, discarded_items = await scraping_service.scrape_items(
+            limit=limit,
+            concurrent_workers=max_concurrent,
+            storage_workers=storage_workers,
+            exclusion_filters=exclude_prefixes or [],
+            async_storage=async_storage and save_to_db,
+            headless=headless,
+            partial_results_file=partial_results_file,
+        )
+    finally:
+        # Browser is shared across runs, release it once this run is done
+        await BrowserManager.shutdown()
 
     # Save to database if requested and NOT using async storage
     if save_to_db and not async_storage and items:
@@ -80,8 +96,6 @@ async def scrape_only(
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        import json
-
         json_data = []
 
         # Add valid items (sorted by profitability)
@@ -124,8 +138,7 @@ async def scrape_only(
                 ]
             )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        write_json_array(str(output_path), json_data)
         logger.info(
             "items_saved_to_file",
             path=str(output_path),
@@ -133,6 +146,9 @@ async def scrape_only(
             discarded=len(discarded_items),
         )
 
+    # Final results are on disk (or no file was requested), drop the JSONL
+    scraping_service.file_saver.clear_partial_results(partial_results_file)
+
     return items, discarded_items
 
 
@@ -184,6 +200,12 @@ def cli():
     type=int,
     help="Number of dedicated storage workers for DB operations (default: 2, only used with async storage)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore cached detailed results and scrape every item again",
+)
 def scrape(
     headless: Optional[bool],
     concurrent: Optional[int],
@@ -194,6 +216,7 @@ def scrape(
     quiet: bool,
     no_async_storage: bool,
     storage_workers: int,
+    no_cache: bool,
 ):
     """Run scraper only (no agents, no graph)
 
@@ -210,8 +233,10 @@ def scrape(
         concurrent if concurrent is not None else settings.max_concurrent
     )
 
-    if concurrent_workers < 1 or concurrent_workers > 5:
-        click.echo("Error: concurrent must be between 1 and 5", err=True)
+    if concurrent_workers < 1 or concurrent_workers > MAX_CONCURRENT_LIMIT:
+        click.echo(
+            f"Error: concurrent must be between 1 and {MAX_CONCURRENT_LIMIT}", err=True
+        )
         sys.exit(1)
 
     exclude_list = list(exclude) if exclude else []
@@ -227,14 +252,14 @@ def scrape(
 
     if not quiet:
         click.echo(f"\n🚀 CS-Tracker Scraper")
-        click.echo(f"{'='*60}")
+        click.echo(BANNER)
         click.echo(
             f"Mode: {'Headless' if headless_mode else 'Visible'} | Workers: {concurrent_workers} | Limit: {limit or 'No limit'}"
         )
         if exclude_list:
             click.echo(f"Exclusions: {', '.join(exclude_list)}")
         click.echo(f"Output: {output}")
-        click.echo(f"{'='*60}\n")
+        click.echo(f"{BANNER}\n")
 
     items, discarded = asyncio.run(
         scrape_only(
@@ -247,11 +272,12 @@ def scrape(
             quiet=quiet,
             async_storage=not no_async_storage,  # Inverted: async by default
             storage_workers=storage_workers,
+            use_cache=not no_cache,
         )
     )
 
     if not quiet:
-        click.echo(f"\n{'='*60}")
+        click.echo(f"\n{BANNER}")
 
     # Log completion summary
     logger.info(
@@ -260,12 +286,12 @@ def scrape(
 
     click.echo(f"✅ Completed! {len(items)} valid items, {len(discarded)} discarded")
     if not quiet:
-        click.echo(f"{'='*60}")
+        click.echo(BANNER)
 
     if items and not quiet:
-        click.echo(f"\n{'='*60}")
+        click.echo(f"\n{BANNER}")
         click.echo(f"📊 Top Items by ROI (Best to Worst)")
-        click.echo(f"{'='*60}")
+        click.echo(BANNER)
         sorted_items = sorted(
             items, key=lambda x: x.profitability_percent, reverse=True
         )
@@ -302,7 +328,7 @@ def scrape(
                 f"\033[96m€{item.steam_avg_price_eur:.2f}\033[0m "
                 f"({roi_color}€{item.profit_eur:.2f} - {item.profitability_percent:.2f}%\033[0m)"
             )
-        click.echo(f"{'='*60}")
+        click.echo(BANNER)
 
 
 @cli.command()
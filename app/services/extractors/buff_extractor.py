@@ -6,177 +6,414 @@ Uses production-tested selectors from working implementation.
 import random
 import re
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
-from typing import Optional, List, Dict
+from contextlib import nullcontext
+from typing import AsyncContextManager, Awaitable, Callable, Optional, List, Dict
 from app.core.logger import get_logger
 from app.core.constants import (
     BUFF_INITIAL_DELAY_MIN,
     BUFF_INITIAL_DELAY_MAX,
     BUFF_RETRY_DELAY_MIN,
     BUFF_RETRY_DELAY_MAX,
+    BUFF_PRICE_SAMPLE_SIZE,
+    BLANK_PAGE_RESET_WAIT,
     PAGE_WAIT_DYNAMIC_CONTENT,
+    PRICE_DROP_THRESHOLD_PERCENT,
 )
+from app.domain.rules import calculate_profit, convert_cny_to_eur
+from app.services.utils.rate_limiter import HostRateLimiter
 
 logger = get_logger(__name__)
 
+# BUFF JSON API, answered with the same session cookies as the pages
+BUFF_SELL_ORDER_API = "https://buff.163.com/api/market/goods/sell_order"
+BUFF_BILL_ORDER_API = "https://buff.163.com/api/market/goods/bill_order"
+BUFF_GOODS_ID_RE = re.compile(r"/goods/(\d+)")
+
+# Polling interval for page readiness conditions (ms)
+CONDITION_POLL_MS = 200
+
+# [selector, min_count] -> true once enough rows are in the DOM
+ROW_COUNT_JS = """
+([selector, minCount]) => document.querySelectorAll(selector).length >= minCount
+"""
+
+# History tab has replaced the selling listings
+HISTORY_READY_JS = """
+() => !document.querySelector("tr.selling")
+    && document.querySelectorAll("table tbody tr").length > 0
+"""
+
+# Recent trades below this share of the current average flag a dump
+PRICE_DROP_RATIO = 1 - PRICE_DROP_THRESHOLD_PERCENT / 100
+
+# Strip "¥" and whitespace in the page: "¥ 10.8" -> "10.8"
+CLEAN_PRICE_JS = '(el) => (el.textContent || "").replace(/[¥\\s]/g, "")'
+
+CLEAN_PRICES_JS = f"""
+(elements, limit) => elements.slice(0, limit).map({CLEAN_PRICE_JS})
+"""
+
+# Pagination, row counts and the cheapest listing prices in one evaluate call
+BUFF_SELLING_JS = f"""
+(limit) => {{
+    const links = document.querySelectorAll("div.pager a.page-link");
+    let maxPage = 1;
+    for (const link of links) {{
+        const href = link.getAttribute("href") || "";
+        const pos = href.indexOf("#page_num=");
+        if (pos >= 0) {{
+            const pageNum = parseInt(href.slice(pos + 10), 10);
+            if (!Number.isNaN(pageNum)) {{
+                maxPage = Math.max(maxPage, pageNum);
+            }}
+        }}
+    }}
+    const prices = Array.from(
+        document.querySelectorAll("tr.selling strong.f_Strong")
+    ).slice(0, limit);
+    return {{
+        has_pager: links.length > 0,
+        max_page: maxPage,
+        selling_count: document.querySelectorAll("tr.selling").length,
+        generic_count: document.querySelectorAll("table tbody tr").length,
+        prices: prices.map({CLEAN_PRICE_JS}),
+    }};
+}}
+"""
+
 
 class BuffExtractor:
     """Handles all BUFF163-specific extraction logic with real selectors."""
 
-    def __init__(self, timeout: int = 15000):
+    def __init__(
+        self,
+        timeout: int = 15000,
+        min_volume: int = 0,
+        rate_limiter: Optional[HostRateLimiter] = None,
+    ):
         self.timeout = timeout  # 15s timeout for BUFF
+        # Items below this many listings are discarded by the caller anyway
+        self.min_volume = min_volume
+        self.rate_limiter = rate_limiter
 
-    async def extract_buff_url(self, page: Page) -> Optional[str]:
-        """Extract BUFF URL from SteamDT item page."""
-        try:
-            buff_link = page.locator('a[href*="buff.163.com"]').first
-            buff_url = await buff_link.get_attribute("href")
-            return buff_url
-        except Exception as e:
-            logger.error("buff_url_extraction_error", error=str(e))
-        return None
+    def _throttle(self, url: str) -> AsyncContextManager[None]:
+        """Pace and time a request with the shared per-host limiter, if any."""
+        if self.rate_limiter:
+            return self.rate_limiter.throttle(url)
+        return nullcontext()
 
     async def extract_buff_data(
-        self, page: Page, buff_url: str, item_name: str, worker_id: Optional[int] = None
+        self,
+        page: Page,
+        buff_url: str,
+        item_name: str,
+        worker_id: Optional[int] = None,
+        steam_price: Optional[Callable[[], Awaitable[Optional[float]]]] = None,
     ) -> Optional[dict]:
-        """Extract complete BUFF market data using real selectors."""
+        """Extract complete BUFF market data using real selectors.
+
+        steam_price, when given, resolves the Steam price in EUR. Items whose
+        lowest listing cannot be sold at a profit there skip the trade history
+        and come back marked "unprofitable".
+        """
         try:
             # Clean URL and navigate to selling tab
             base_url = buff_url.split("#")[0].split("?")[0]
             selling_url = f"{base_url}?from=market#tab=selling"
 
-            logger.info("navigating_to_buff", worker_id=worker_id, url=selling_url)
+            logger.debug("navigating_to_buff", worker_id=worker_id, url=selling_url)
 
             # Random delay to avoid anti-bot (especially with concurrent workers)
             delay = random.randint(BUFF_INITIAL_DELAY_MIN, BUFF_INITIAL_DELAY_MAX)
             logger.debug("buff_initial_delay", delay_ms=delay)
             await page.wait_for_timeout(delay)
 
-            try:
+            # Cheap path: BUFF's JSON API through the page's request context
+            # (same cookies, no rendering); the rendered page is the fallback
+            api_listings = await self._fetch_api_listings(page, base_url, worker_id)
+            if api_listings:
+                selling_items, total_volume = api_listings
+            else:
+                page_listings = await self._extract_selling_page(
+                    page, selling_url, worker_id
+                )
+                if page_listings is None:
+                    return None
+                selling_items, total_volume = page_listings
+
+            if not selling_items:
+                logger.warning("no_buff_selling_items", item=item_name)
+                return None
+
+            if total_volume < self.min_volume:
+                # Discarded for low volume regardless of trades, skip the tab
+                return self._build_buff_data(item_name, selling_items, [], total_volume)
+
+            if steam_price and not await self._can_be_profitable(
+                item_name, selling_items, steam_price
+            ):
+                return {
+                    "platform": "BUFF",
+                    "unprofitable": True,
+                    "lowest_price": min(item["price_cny"] for item in selling_items),
+                    "total_volume": total_volume,
+                }
+
+            # Trade history: one JSON call, the history tab only as fallback
+            trade_records = await self._fetch_api_trades(page, base_url, worker_id)
+            if trade_records is None:
+                trade_records = await self._extract_history_tab(page, base_url)
+
+            return self._build_buff_data(
+                item_name, selling_items, trade_records, total_volume
+            )
+
+        except Exception as e:
+            logger.error("buff_extraction_error", error=str(e), url=buff_url)
+            return None
+
+    @staticmethod
+    async def _can_be_profitable(
+        item_name: str,
+        selling_items: List[Dict],
+        steam_price: Callable[[], Awaitable[Optional[float]]],
+    ) -> bool:
+        """False when even the lowest listing loses money sold on Steam.
+
+        The final result uses the listings average, which is never below the
+        lowest listing, so such an item cannot turn profitable later.
+        """
+        steam_eur = await steam_price()
+        if not steam_eur:
+            return True  # Unknown Steam price: keep the full extraction
+
+        lowest_eur = convert_cny_to_eur(
+            min(item["price_cny"] for item in selling_items)
+        )
+        if calculate_profit(lowest_eur, steam_eur) > 0:
+            return True
+
+        logger.debug(
+            "buff_precheck_unprofitable",
+            item=item_name,
+            lowest_eur=round(lowest_eur, 2),
+            steam_eur=round(steam_eur, 2),
+        )
+        return False
+
+    async def _extract_selling_page(
+        self, page: Page, selling_url: str, worker_id: Optional[int] = None
+    ) -> Optional[tuple[List[Dict], int]]:
+        """Navigate to the rendered selling tab and read its listings.
+
+        Returns None when navigation fails.
+        """
+        try:
+            # extract_selling_items waits for the listing rows
+            async with self._throttle(selling_url):
                 await page.goto(
                     selling_url, wait_until="domcontentloaded", timeout=self.timeout
                 )
-                await page.wait_for_timeout(PAGE_WAIT_DYNAMIC_CONTENT)
-            except PlaywrightTimeout:
-                logger.error("buff_navigation_timeout", url=selling_url)
-                return None
-            except Exception as e:
-                # Handle ERR_ABORTED and other navigation errors
-                error_msg = str(e)
-                if (
-                    "ERR_ABORTED" in error_msg
-                    or "net::" in error_msg
-                    or "ERR_" in error_msg
-                ):
-                    logger.warning(
-                        "buff_navigation_aborted_retrying",
+        except PlaywrightTimeout:
+            logger.error("buff_navigation_timeout", url=selling_url)
+            return None
+        except Exception as e:
+            # Handle ERR_ABORTED and other navigation errors
+            error_msg = str(e)
+            if (
+                "ERR_ABORTED" in error_msg
+                or "net::" in error_msg
+                or "ERR_" in error_msg
+            ):
+                logger.warning(
+                    "buff_navigation_aborted_retrying",
+                    worker_id=worker_id,
+                    url=selling_url,
+                    error=error_msg[:150],
+                )
+                # Retry with longer wait and different strategy
+                try:
+                    # Wait much longer before retry (simulate human behavior)
+                    retry_delay = random.randint(
+                        BUFF_RETRY_DELAY_MIN, BUFF_RETRY_DELAY_MAX
+                    )
+                    logger.info(
+                        "waiting_before_retry",
                         worker_id=worker_id,
-                        url=selling_url,
-                        error=error_msg[:150],
+                        delay_ms=retry_delay,
                     )
-                    # Retry with longer wait and different strategy
+                    await page.wait_for_timeout(retry_delay)
+
+                    # Navigate to blank first to reset page state
                     try:
-                        # Wait much longer before retry (simulate human behavior)
-                        retry_delay = random.randint(
-                            BUFF_RETRY_DELAY_MIN, BUFF_RETRY_DELAY_MAX
-                        )
-                        logger.info(
-                            "waiting_before_retry",
-                            worker_id=worker_id,
-                            delay_ms=retry_delay,
+                        await page.goto(
+                            "about:blank",
+                            wait_until="domcontentloaded",
+                            timeout=5000,
                         )
-                        await page.wait_for_timeout(retry_delay)
+                    except Exception:
+                        pass  # Ignore errors when going to blank
 
-                        # Navigate to blank first to reset page state
-                        try:
-                            await page.goto(
-                                "about:blank",
-                                wait_until="domcontentloaded",
-                                timeout=5000,
-                            )
-                        except:
-                            pass  # Ignore errors when going to blank
+                    await page.wait_for_timeout(BLANK_PAGE_RESET_WAIT)
 
-                        await page.wait_for_timeout(2000)
-
-                        # Try goto again with different wait strategy
+                    # Try goto again with different wait strategy
+                    async with self._throttle(selling_url):
                         await page.goto(selling_url, wait_until="load", timeout=30000)
-                        await page.wait_for_timeout(5000)
-                        logger.info(
-                            "buff_retry_succeeded", worker_id=worker_id, url=selling_url
-                        )
-                    except Exception as retry_error:
-                        logger.error(
-                            "buff_navigation_retry_failed",
-                            worker_id=worker_id,
-                            url=selling_url,
-                            error=str(retry_error)[:150],
-                        )
-                        return None
-                else:
+                    await self._wait_for_condition(
+                        page, ROW_COUNT_JS, ["tr.selling", 1], 5000
+                    )
+                    logger.info(
+                        "buff_retry_succeeded", worker_id=worker_id, url=selling_url
+                    )
+                except Exception as retry_error:
                     logger.error(
-                        "buff_navigation_error", url=selling_url, error=error_msg[:150]
+                        "buff_navigation_retry_failed",
+                        worker_id=worker_id,
+                        url=selling_url,
+                        error=str(retry_error)[:150],
                     )
                     return None
-
-            # Extract selling items
-            selling_items, total_volume = await self.extract_selling_items(page)
-
-            if not selling_items:
-                logger.warning("no_buff_selling_items", item=item_name)
+            else:
+                logger.error(
+                    "buff_navigation_error", url=selling_url, error=error_msg[:150]
+                )
                 return None
 
-            # Navigate to trade history
-            history_url = f"{base_url}?from=market#tab=history"
+        return await self.extract_selling_items(page)
 
-            try:
+    async def _extract_history_tab(self, page: Page, base_url: str) -> List[Dict]:
+        """Switch the rendered page to the history tab and read its trades."""
+        history_url = f"{base_url}?from=market#tab=history"
+
+        try:
+            async with self._throttle(history_url):
                 await page.goto(
                     history_url, wait_until="domcontentloaded", timeout=self.timeout
                 )
-                await page.wait_for_timeout(PAGE_WAIT_DYNAMIC_CONTENT)
-            except PlaywrightTimeout:
-                logger.warning("buff_history_timeout")
-                trade_records = []
+            # Hash-only navigation: the selling rows stay in the DOM until
+            # the history tab replaces them, and they match the trade row
+            # selector, so wait for the swap
+            await self._wait_for_condition(
+                page, HISTORY_READY_JS, None, PAGE_WAIT_DYNAMIC_CONTENT
+            )
+        except PlaywrightTimeout:
+            logger.warning("buff_history_timeout")
 
-            trade_records = await self.extract_trade_records(page)
+        return await self.extract_trade_records(page)
 
-            # Validate price stability (detect dumps)
-            if not self.validate_price_difference(selling_items, trade_records):
-                logger.warning(
-                    "price_drop_detected",
-                    item=item_name,
-                    reason="Recent trades 10%+ cheaper than current listings",
-                )
-                return None
-
-            # Calculate averages
-            avg_selling = (
-                sum(float(item["price"]) for item in selling_items) / len(selling_items)
-                if selling_items
-                else 0.0
-            )
-            avg_trade = (
-                sum(float(trade["price"]) for trade in trade_records)
-                / len(trade_records)
-                if trade_records
-                else 0.0
+    def _build_buff_data(
+        self,
+        item_name: str,
+        selling_items: List[Dict],
+        trade_records: List[Dict],
+        total_volume: int,
+    ) -> Optional[dict]:
+        """Summarize listings and trades, or None if prices look like a dump."""
+        # Averages are computed once and shared by the dump check and result
+        selling_prices = [item["price_cny"] for item in selling_items]
+        trade_prices = [trade["price_cny"] for trade in trade_records]
+        avg_selling = sum(selling_prices) / len(selling_prices)
+        avg_trade = sum(trade_prices) / len(trade_prices) if trade_prices else 0.0
+
+        # Validate price stability (detect dumps)
+        if not self._is_price_stable(avg_selling, avg_trade):
+            logger.warning(
+                "price_drop_detected",
+                item=item_name,
+                reason="Recent trades 10%+ cheaper than current listings",
             )
+            return None
+
+        return {
+            "platform": "BUFF",
+            "avg_price": avg_selling if avg_selling > 0 else avg_trade,
+            "lowest_price": min(selling_prices),
+            "selling_items": selling_items,
+            "trade_records": trade_records,
+            "total_volume": total_volume,  # Total items in market
+            "volume_24h": len(trade_records),
+        }
+
+    async def _fetch_api_listings(
+        self, page: Page, base_url: str, worker_id: Optional[int] = None
+    ) -> Optional[tuple[List[Dict], int]]:
+        """Read listings from BUFF's sell_order JSON API.
+
+        Returns (selling_items, total_volume), or None when the API is
+        unusable (not logged in, rate limited, unknown URL format).
+        """
+        params = self._api_params(base_url)
+        if not params:
+            return None
+
+        try:
+            sell_data = await self._get_api_data(page, BUFF_SELL_ORDER_API, params)
+        except Exception as e:
+            logger.debug("buff_api_fallback", worker_id=worker_id, error=str(e))
+            return None
+
+        if not sell_data:
+            return None
 
-            return {
-                "platform": "BUFF",
-                "avg_price": avg_selling if avg_selling > 0 else avg_trade,
-                "lowest_price": min(
-                    (float(i["price"]) for i in selling_items), default=0.0
-                ),
-                "selling_items": selling_items,
-                "trade_records": trade_records,
-                "total_volume": total_volume,  # Total items in market
-                "volume_24h": len(trade_records),
-            }
+        selling_items = self._parse_api_prices(sell_data)
+        if not selling_items:
+            return None
 
+        total_volume = int(
+            sell_data.get("total_count") or len(sell_data.get("items") or [])
+        )
+
+        logger.debug(
+            "buff_api_fast_path",
+            worker_id=worker_id,
+            listings=len(selling_items),
+            total=total_volume,
+        )
+        return selling_items, total_volume
+
+    async def _fetch_api_trades(
+        self, page: Page, base_url: str, worker_id: Optional[int] = None
+    ) -> Optional[List[Dict]]:
+        """Recent trades from the bill_order endpoint, or None if unavailable."""
+        params = self._api_params(base_url)
+        if not params:
+            return None
+
+        try:
+            bill_data = await self._get_api_data(page, BUFF_BILL_ORDER_API, params)
         except Exception as e:
-            logger.error("buff_extraction_error", error=str(e), url=buff_url)
+            logger.debug("buff_api_trades_fallback", worker_id=worker_id, error=str(e))
             return None
 
+        if bill_data is None:
+            return None
+        return self._parse_api_prices(bill_data)
+
+    @staticmethod
+    def _api_params(base_url: str) -> Optional[Dict]:
+        """Query for the BUFF API, keyed by the goods_id in the item URL."""
+        match = BUFF_GOODS_ID_RE.search(base_url)
+        if not match:
+            return None
+        return {"game": "csgo", "goods_id": match.group(1), "page_num": 1}
+
+    @classmethod
+    def _parse_api_prices(cls, data: Dict) -> List[Dict]:
+        """First prices of a sell_order/bill_order "data" object."""
+        orders = (data.get("items") or [])[:BUFF_PRICE_SAMPLE_SIZE]
+        return cls._parse_prices([str(order.get("price", "")) for order in orders])
+
+    async def _get_api_data(self, page: Page, url: str, params: Dict) -> Optional[Dict]:
+        """GET a BUFF API endpoint; returns its "data" object on success."""
+        async with self._throttle(url):
+            response = await page.request.get(url, params=params, timeout=self.timeout)
+        if not response.ok:
+            return None
+        payload = await response.json()
+        if payload.get("code") != "OK":
+            return None
+        return payload.get("data")
+
     async def extract_selling_items(self, page: Page) -> tuple[List[Dict], int]:
         """Extract current BUFF selling listings with production selectors.
         Returns: (selling_items, total_volume)
@@ -196,122 +433,39 @@ class BuffExtractor:
                     logger.error("no_buff_table_found")
                     return [], 0
 
-            # Calculate total volume from pagination
+            # Pagination renders after the rows; single-page items have none
             try:
-                # Wait a bit for pagination to load
-                await page.wait_for_timeout(1000)
-
-                # Check if pagination exists - look for page links
-                page_links = await page.locator("div.pager a.page-link").all()
-
-                if len(page_links) > 0:
-                    # Get all page numbers from links
-                    max_page = 1
-                    for link in page_links:
-                        href = await link.get_attribute("href")
-                        if href and "#page_num=" in href:
-                            try:
-                                page_num = int(href.split("#page_num=")[-1])
-                                max_page = max(max_page, page_num)
-                            except ValueError:
-                                continue
-
-                    # Get current page rows to know items per page
-                    current_rows = await page.locator("tr.selling").all()
-                    items_per_page = len(current_rows) if current_rows else 10
-                    total_volume = max_page * items_per_page
-                    logger.info(
-                        "buff_total_calculated_from_pagination",
-                        pages=max_page,
-                        per_page=items_per_page,
-                        total=total_volume,
-                    )
-                else:
-                    # No pagination, just count current rows
-                    current_rows = await page.locator("tr.selling").all()
-                    total_volume = len(current_rows)
-                    logger.info("no_pagination_found", total=total_volume)
-            except Exception as e:
-                logger.warning("pagination_calculation_failed", error=str(e))
-                # Fallback: count current rows
-                current_rows = await page.locator("tr.selling").all()
-                total_volume = len(current_rows)
-
-            # Get rows for price extraction (first page only)
-            rows = await page.locator("tr.selling").all()
-            logger.debug("buff_rows_located", count=len(rows))
-
-            if len(rows) == 0:
+                await page.wait_for_selector("div.pager", timeout=1000)
+            except PlaywrightTimeout:
+                pass
+
+            # Pagination, row counts and cleaned prices in one round-trip
+            data = await page.evaluate(BUFF_SELLING_JS, BUFF_PRICE_SAMPLE_SIZE)
+
+            if data["has_pager"]:
+                items_per_page = data["selling_count"] or 10
+                total_volume = data["max_page"] * items_per_page
+                logger.debug(
+                    "buff_total_calculated_from_pagination",
+                    pages=data["max_page"],
+                    per_page=items_per_page,
+                    total=total_volume,
+                )
+            else:
+                # No pagination, just count current rows
+                total_volume = data["selling_count"]
+                logger.debug("no_pagination_found", total=total_volume)
+
+            logger.debug("buff_rows_located", count=data["selling_count"])
+            if data["selling_count"] == 0:
                 logger.warning("no_selling_rows_using_generic")
-                rows = await page.locator("table tbody tr").all()
                 if total_volume == 0:
-                    total_volume = len(rows)
-
-            rows_to_process = rows[
-                :5
-            ]  # Get up to 5 cheapest listings for price calculation (same as Steam)
+                    total_volume = data["generic_count"]
 
-            logger.info("buff_extracting_prices", rows_to_process=len(rows_to_process))
-
-            # Batch extract all prices at once instead of sequential loop
-            try:
-                # Get all price elements in one go
-                all_price_elements = page.locator("tr.selling strong.f_Strong")
-
-                # Get count to ensure we have elements
-                price_count = await all_price_elements.count()
-
-                if price_count > 0:
-                    # Extract all text contents in parallel (much faster than loop)
-                    all_prices_text = await all_price_elements.all_text_contents()
-
-                    # Process only first 5 prices
-                    for idx, price_text in enumerate(all_prices_text[:5]):
-                        try:
-                            # Clean: "¥ 10.8" -> "10.8"
-                            price_cny = re.sub(r"[¥\s]", "", price_text).strip()
-
-                            if price_cny and float(price_cny) > 0:
-                                selling_items.append(
-                                    {
-                                        "price": price_cny,
-                                        "price_cny": float(price_cny),
-                                        "platform": "BUFF",
-                                    }
-                                )
-                                logger.debug(
-                                    "buff_price_extracted",
-                                    row_index=idx,
-                                    price=price_cny,
-                                )
-
-                        except Exception as e:
-                            logger.debug("buff_item_parse_error", row=idx, error=str(e))
-                            continue
-                else:
-                    logger.warning("no_buff_price_elements_found")
-
-            except Exception as e:
-                logger.error("buff_batch_extraction_failed", error=str(e))
-                # Fallback to old method if batch fails
-                for idx, row in enumerate(rows_to_process):
-                    try:
-                        price_element = row.locator("strong.f_Strong")
-                        price_text = await price_element.inner_text(timeout=2000)
-                        price_cny = re.sub(r"[¥\s]", "", price_text).strip()
-
-                        if price_cny and float(price_cny) > 0:
-                            selling_items.append(
-                                {
-                                    "price": price_cny,
-                                    "price_cny": float(price_cny),
-                                    "platform": "BUFF",
-                                }
-                            )
-
-                    except Exception as e:
-                        logger.debug("buff_item_parse_error", row=idx, error=str(e))
-                        continue
+            selling_items = self._parse_prices(data["prices"])
+            if not data["prices"]:
+                logger.warning("no_buff_price_elements_found")
+            logger.debug("buff_extracting_prices", rows_to_process=len(selling_items))
 
         except Exception as e:
             logger.error("buff_selling_extraction_error", error=str(e))
@@ -320,8 +474,6 @@ class BuffExtractor:
 
     async def extract_trade_records(self, page: Page) -> List[Dict]:
         """Extract recent BUFF trade history with production selectors."""
-        trade_records = []
-
         try:
             # Wait for trade history table
             try:
@@ -330,60 +482,50 @@ class BuffExtractor:
                 logger.warning("buff_trades_timeout")
                 return []
 
-            # Get recent trades
-            rows = await page.locator("table tbody tr").all()
-
-            rows_to_process = rows[:5]  # Last 5 trades
-
-            # Batch extract trade prices for speed
-            try:
-                all_trade_prices = page.locator("table tbody tr strong.f_Strong")
-                price_count = await all_trade_prices.count()
-
-                if price_count > 0:
-                    all_prices_text = await all_trade_prices.all_text_contents()
-
-                    for idx, price_text in enumerate(all_prices_text[:5]):
-                        try:
-                            price_cny = re.sub(r"[¥\s]", "", price_text).strip()
-
-                            if price_cny and float(price_cny) > 0:
-                                trade_records.append(
-                                    {
-                                        "price": price_cny,
-                                        "price_cny": float(price_cny),
-                                        "platform": "BUFF",
-                                    }
-                                )
-                        except Exception as e:
-                            logger.debug("trade_parse_error", row=idx, error=str(e))
-                            continue
-
-            except Exception as e:
-                logger.warning("batch_trade_extraction_failed", error=str(e))
-                # Fallback to row-by-row if batch fails
-                for idx, row in enumerate(rows_to_process):
-                    try:
-                        price_element = row.locator("strong.f_Strong")
-                        price_text = await price_element.inner_text()
-                        price_cny = re.sub(r"[¥\s]", "", price_text).strip()
-
-                        if price_cny and float(price_cny) > 0:
-                            trade_records.append(
-                                {
-                                    "price": price_cny,
-                                    "price_cny": float(price_cny),
-                                    "platform": "BUFF",
-                                }
-                            )
-                    except Exception as e:
-                        logger.debug("trade_parse_error", row=idx, error=str(e))
-                        continue
+            # Last trades, cleaned in the page
+            prices = await page.eval_on_selector_all(
+                "table tbody tr strong.f_Strong",
+                CLEAN_PRICES_JS,
+                BUFF_PRICE_SAMPLE_SIZE,
+            )
+            return self._parse_prices(prices)
 
         except Exception as e:
             logger.error("buff_trades_extraction_error", error=str(e))
 
-        return trade_records
+        return []
+
+    @staticmethod
+    async def _wait_for_condition(
+        page: Page, expression: str, arg, timeout_ms: int
+    ) -> bool:
+        """Poll a JS condition until true or timeout; returns whether it held."""
+        try:
+            await page.wait_for_function(
+                expression, arg=arg, timeout=timeout_ms, polling=CONDITION_POLL_MS
+            )
+            return True
+        except PlaywrightTimeout:
+            logger.debug("buff_wait_condition_timeout", timeout_ms=timeout_ms)
+            return False
+
+    @staticmethod
+    def _parse_prices(prices: List[str]) -> List[Dict]:
+        """Turn cleaned CNY price strings into BUFF price entries."""
+        parsed = []
+        for idx, price_cny in enumerate(prices):
+            if not price_cny:
+                continue
+            try:
+                value = float(price_cny)
+            except ValueError as e:
+                logger.debug("buff_item_parse_error", row=idx, error=str(e))
+                continue
+            if value > 0:
+                parsed.append(
+                    {"price": price_cny, "price_cny": value, "platform": "BUFF"}
+                )
+        return parsed
 
     def validate_price_difference(
         self, selling_items: List[Dict], trade_records: List[Dict]
@@ -395,15 +537,18 @@ class BuffExtractor:
         if not selling_items or not trade_records:
             return True  # Cannot validate without data
 
-        # Current average selling price
-        current_avg = sum(float(i["price"]) for i in selling_items) / len(selling_items)
+        current_avg = sum(i["price_cny"] for i in selling_items) / len(selling_items)
+        recent_avg = sum(t["price_cny"] for t in trade_records) / len(trade_records)
+        return self._is_price_stable(current_avg, recent_avg)
 
-        # Recent trades average
-        recent_avg = sum(float(t["price"]) for t in trade_records) / len(trade_records)
+    @staticmethod
+    def _is_price_stable(current_avg: float, recent_avg: float) -> bool:
+        """False when recent trades average 10%+ below current listings."""
+        if current_avg <= 0 or recent_avg <= 0:
+            return True  # Cannot validate without data
 
         # If recent trades are 10%+ cheaper, it's a potential dump
-        threshold = 0.90
-        if recent_avg < current_avg * threshold:
+        if recent_avg < current_avg * PRICE_DROP_RATIO:
             logger.warning(
                 "price_drop_alert",
                 current=current_avg,
@@ -1,22 +1,79 @@
 import asyncio
-from playwright.async_api import Page, BrowserContext
-from typing import Optional, Dict
+import httpx
+from datetime import date
+from pathlib import Path
+from playwright.async_api import Page, BrowserContext, TimeoutError as PlaywrightTimeout
+from typing import Dict, Optional, Tuple
 
 from app.core.logger import get_logger
 from app.core.config import Settings
-from app.domain.rules import calculate_profit, calculate_roi, convert_cny_to_eur
+from app.core.constants import (
+    EXCHANGE_RATE_TTL_HOURS,
+    EXCHANGE_RATE_URL,
+    HOST_RATE_LIMITS,
+    HTTP_CLIENT_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_USER_AGENT,
+    URL_CACHE_TTL_HOURS,
+)
+from app.domain.rules import (
+    calculate_profit,
+    calculate_roi,
+    convert_cny_to_eur,
+    set_cny_to_eur_rate,
+)
+from app.services.utils.cache import ResultCache
+from app.services.utils.rate_limiter import HostRateLimiter
 from .buff_extractor import BuffExtractor
 from .steam_extractor import SteamExtractor
 
 logger = get_logger(__name__)
 
+# First BUFF and Steam Market links on a SteamDT item page
+PLATFORM_URLS_JS = """
+() => {
+    const buff = document.querySelector('a[href*="buff.163.com"]');
+    const steam = document.querySelector('a[href*="steamcommunity.com/market"]');
+    return [
+        buff ? buff.getAttribute("href") : null,
+        steam ? steam.getAttribute("href") : null,
+    ];
+}
+"""
+
 
 class DetailedItemExtractor:
 
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or Settings()
-        self.buff_extractor = BuffExtractor(timeout=15000)
-        self.steam_extractor = SteamExtractor(timeout=10000)
+        # Resolved once, read for every item
+        self.min_volume = self.settings.min_volume
+        # One limiter for every worker, so pacing holds across pages
+        self.rate_limiter = HostRateLimiter(HOST_RATE_LIMITS)
+        self.buff_extractor = BuffExtractor(
+            timeout=15000, min_volume=self.min_volume, rate_limiter=self.rate_limiter
+        )
+        self.steam_extractor = SteamExtractor(
+            timeout=10000, rate_limiter=self.rate_limiter
+        )
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.result_cache: Optional[ResultCache] = None
+        self.url_cache: Optional[ResultCache] = None
+        self.rate_cache: Optional[ResultCache] = None
+        if self.settings.cache_enabled:
+            self.result_cache = ResultCache(
+                Path(self.settings.cache_dir) / "detailed_items.json",
+                ttl_seconds=self.settings.cache_ttl_hours * 3600,
+            )
+            # Platform links of an item page rarely change; keep them longer
+            self.url_cache = ResultCache(
+                Path(self.settings.cache_dir) / "platform_urls.json",
+                ttl_seconds=URL_CACHE_TTL_HOURS * 3600,
+            )
+            self.rate_cache = ResultCache(
+                Path(self.settings.cache_dir) / "exchange_rate.json",
+                ttl_seconds=EXCHANGE_RATE_TTL_HOURS * 3600,
+            )
 
     async def extract_detailed_item(
         self,
@@ -26,15 +83,96 @@ class DetailedItemExtractor:
         steam_page: Optional[Page] = None,
         context: Optional[BrowserContext] = None,  # Backward compatibility
         worker_id: Optional[int] = None,
+    ) -> Optional[Dict]:
+        cache_key = self._cache_key(item) if self.result_cache else None
+        if cache_key:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("detailed_item_cache_hit", item=item["item_name"])
+                return dict(cached)
+
+        result = await self._extract_detailed_item(
+            page, item, buff_page, steam_page, context, worker_id
+        )
+
+        # Only successful results are cached so transient failures are retried
+        if cache_key and result and not result.get("discarded"):
+            self.result_cache.set(cache_key, result)
+        return result
+
+    def open_http_client(self):
+        """Create the HTTP client shared by all workers for static endpoints."""
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                timeout=HTTP_CLIENT_TIMEOUT,
+                headers={"User-Agent": HTTP_USER_AGENT},
+                limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+                follow_redirects=True,
+            )
+
+    async def close_http_client(self):
+        """Close the shared HTTP client."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+
+    async def refresh_exchange_rate(self):
+        """Load the live CNY/EUR rate, at most one request per cache TTL.
+
+        Keeps the hardcoded fallback rate if the request fails.
+        """
+        cny_per_eur = self.rate_cache.get("CNY") if self.rate_cache else None
+        if cny_per_eur is None and self.http_client is not None:
+            try:
+                response = await self.http_client.get(EXCHANGE_RATE_URL)
+                response.raise_for_status()
+                cny_per_eur = float(response.json()["rates"]["CNY"])
+            except Exception as e:
+                logger.warning("exchange_rate_fetch_failed", error=str(e))
+                return
+            if self.rate_cache:
+                self.rate_cache.set("CNY", cny_per_eur)
+
+        if cny_per_eur is not None:
+            set_cny_to_eur_rate(cny_per_eur)
+            logger.info("exchange_rate_set", cny_per_eur=cny_per_eur)
+
+    def save_cache(self):
+        """Persist cached detailed results to disk."""
+        if self.result_cache:
+            self.result_cache.save()
+        if self.url_cache:
+            self.url_cache.save()
+        if self.rate_cache:
+            self.rate_cache.save()
+
+    @staticmethod
+    def _cache_key(item: Dict) -> Optional[str]:
+        urls = (item.get("url"), item.get("buff_url"), item.get("steam_url"))
+        if not any(urls):
+            return None
+        return "|".join([date.today().isoformat(), *(url or "" for url in urls)])
+
+    async def _extract_detailed_item(
+        self,
+        page: Page,
+        item: Dict,
+        buff_page: Optional[Page],
+        steam_page: Optional[Page],
+        context: Optional[BrowserContext],
+        worker_id: Optional[int],
     ) -> Optional[Dict]:
         try:
             # Step 1: Get platform URLs
-            buff_url, steam_url = await self._get_platform_urls(page, item)
+            # Workers have no main page; the BUFF page is free until step 2
+            buff_url, steam_url = await self._get_platform_urls(
+                page or buff_page or steam_page, item
+            )
             if not buff_url or not steam_url:
                 return None
 
             # Log URLs being processed
-            logger.info(
+            logger.debug(
                 "processing_item_urls",
                 worker_id=worker_id,
                 item=item["item_name"],
@@ -45,16 +183,8 @@ class DetailedItemExtractor:
             # Step 2 & 3: Extract BUFF and Steam data in parallel
             if buff_page and steam_page:
                 # Use pre-created pages - full parallelism
-                buff_data, steam_data = await asyncio.gather(
-                    self.buff_extractor.extract_buff_data(
-                        buff_page, buff_url, item["item_name"], worker_id=worker_id
-                    ),
-                    self.steam_extractor.extract_steam_data(
-                        steam_page,
-                        steam_url,
-                        item["item_name"],
-                        worker_id=worker_id,
-                    ),
+                buff_data, steam_data = await self._fetch_platform_data(
+                    buff_page, steam_page, buff_url, steam_url, item, worker_id
                 )
             elif context:
                 # Legacy: create pages on-the-fly (backward compatibility)
@@ -63,28 +193,31 @@ class DetailedItemExtractor:
                 if not hasattr(self, "steam_page") or not self.steam_page:
                     self.steam_page = await context.new_page()
 
-                buff_data, steam_data = await asyncio.gather(
-                    self.buff_extractor.extract_buff_data(
-                        self.buff_page, buff_url, item["item_name"], worker_id=worker_id
-                    ),
-                    self.steam_extractor.extract_steam_data(
-                        self.steam_page,
-                        steam_url,
-                        item["item_name"],
-                        worker_id=worker_id,
-                    ),
+                buff_data, steam_data = await self._fetch_platform_data(
+                    self.buff_page,
+                    self.steam_page,
+                    buff_url,
+                    steam_url,
+                    item,
+                    worker_id,
                 )
             else:
                 # Fallback: sequential scraping with single page
                 buff_data = await self.buff_extractor.extract_buff_data(
                     page, buff_url, item["item_name"], worker_id=worker_id
                 )
-                steam_data = await self.steam_extractor.extract_steam_data(
-                    page, steam_url, item["item_name"], worker_id=worker_id
-                )
+                steam_data = None
+                if self._buff_passes(buff_data):
+                    steam_data = await self.steam_extractor.extract_steam_data(
+                        page,
+                        steam_url,
+                        item["item_name"],
+                        worker_id=worker_id,
+                        http_client=self.http_client,
+                    )
 
             if not buff_data:
-                logger.info("item_discarded_buff_validation")
+                logger.debug("item_discarded_buff_validation")
                 return {
                     "item_name": item["item_name"],
                     "quality": item.get("quality"),
@@ -93,52 +226,64 @@ class DetailedItemExtractor:
                     "discard_reason": "BUFF data validation failed",
                 }
 
-            if not steam_data:
-                logger.warning("steam_data_extraction_failed")
-                return {
-                    "item_name": item["item_name"],
-                    "quality": item.get("quality"),
-                    "stattrak": item.get("stattrak", False),
-                    "discarded": True,
-                    "discard_reason": "Steam data extraction failed",
-                }
-
-            # Validate minimum volume (liquidity check)
+            # Validate minimum volume (liquidity check), BUFF first: a low
+            # BUFF volume means the Steam fetch was cancelled
             buff_volume = buff_data.get(
                 "total_volume", 0
             )  # Use total available, not just extracted
-            steam_volume = steam_data.get(
-                "total_volume", 0
-            )  # Use total available from Steam counter
 
-            if buff_volume < self.settings.min_volume:
-                logger.info(
+            if buff_volume < self.min_volume:
+                logger.debug(
                     "item_discarded_low_buff_volume",
                     item=item["item_name"],
                     volume=buff_volume,
-                    required=self.settings.min_volume,
+                    required=self.min_volume,
                 )
                 return {
                     "item_name": item["item_name"],
                     "quality": item.get("quality"),
                     "stattrak": item.get("stattrak", False),
                     "discarded": True,
-                    "discard_reason": f"Low BUFF volume ({buff_volume}/{self.settings.min_volume})",
+                    "discard_reason": f"Low BUFF volume ({buff_volume}/{self.min_volume})",
                 }
 
-            if steam_volume < self.settings.min_volume:
-                logger.info(
+            if buff_data.get("unprofitable"):
+                logger.debug("item_discarded_unprofitable", item=item["item_name"])
+                return {
+                    "item_name": item["item_name"],
+                    "quality": item.get("quality"),
+                    "stattrak": item.get("stattrak", False),
+                    "discarded": True,
+                    "discard_reason": "Unprofitable at lowest BUFF listing",
+                }
+
+            if not steam_data:
+                logger.warning("steam_data_extraction_failed")
+                return {
+                    "item_name": item["item_name"],
+                    "quality": item.get("quality"),
+                    "stattrak": item.get("stattrak", False),
+                    "discarded": True,
+                    "discard_reason": "Steam data extraction failed",
+                }
+
+            steam_volume = steam_data.get(
+                "total_volume", 0
+            )  # Use total available from Steam counter
+
+            if steam_volume < self.min_volume:
+                logger.debug(
                     "item_discarded_low_steam_volume",
                     item=item["item_name"],
                     volume=steam_volume,
-                    required=self.settings.min_volume,
+                    required=self.min_volume,
                 )
                 return {
                     "item_name": item["item_name"],
                     "quality": item.get("quality"),
                     "stattrak": item.get("stattrak", False),
                     "discarded": True,
-                    "discard_reason": f"Low Steam volume ({steam_volume}/{self.settings.min_volume})",
+                    "discard_reason": f"Low Steam volume ({steam_volume}/{self.min_volume})",
                 }
 
             # Step 4: Calculate profitability
@@ -154,11 +299,11 @@ class DetailedItemExtractor:
                 }
 
             # Log precios scrapeados
-            logger.info(
+            logger.debug(
                 "prices_scraped",
-                buff_cny=f"¥{buff_data.get('avg_price', 0):.2f}",
-                buff_eur=f"€{analysis['buff_avg_price']:.2f}",
-                steam_eur=f"€{analysis['steam_avg_price']:.2f}",
+                buff_cny=round(buff_data.get("avg_price", 0), 2),
+                buff_eur=analysis["buff_avg_price"],
+                steam_eur=analysis["steam_avg_price"],
             )
 
             # Step 5: Create detailed data dictionary (like old implementation)
@@ -178,10 +323,10 @@ class DetailedItemExtractor:
                 "profitability_ratio": analysis["profitability_ratio"],
             }
 
-            logger.info(
+            logger.debug(
                 "item_processed_successfully",
-                profitability=f"{analysis['profitability_ratio']:.2%}",
-                profit=f"€{analysis['profit_eur']:.2f}",
+                roi_percent=round(analysis["profitability_ratio"] * 100, 2),
+                profit_eur=analysis["profit_eur"],
             )
             return detailed_data
 
@@ -194,28 +339,104 @@ class DetailedItemExtractor:
     ) -> tuple[Optional[str], Optional[str]]:
         buff_url = item.get("buff_url")
         steam_url = item.get("steam_url")
+        item_url = item.get("url")
+
+        if (not buff_url or not steam_url) and item_url and self.url_cache:
+            cached = self.url_cache.get(item_url)
+            if cached:
+                logger.debug("platform_urls_cache_hit", item=item["item_name"])
+                buff_url = buff_url or cached[0]
+                steam_url = steam_url or cached[1]
 
         if not buff_url or not steam_url:
-            logger.info("extracting_urls_from_steamdt")
-            item_url = item.get("url")
+            logger.debug("extracting_urls_from_steamdt")
             if not item_url:
                 logger.error("no_item_url")
                 return None, None
             await page.goto(item_url, wait_until="domcontentloaded", timeout=5000)
-            await page.wait_for_timeout(1000)
+            try:
+                await page.wait_for_selector(
+                    'a[href*="buff.163.com"], a[href*="steamcommunity.com/market"]',
+                    timeout=5000,
+                )
+            except PlaywrightTimeout:
+                logger.warning("platform_links_wait_timeout", item=item["item_name"])
+
+            # Both platform links in a single round-trip
+            found_buff, found_steam = await page.evaluate(PLATFORM_URLS_JS)
 
             if not buff_url:
-                buff_url = await self.buff_extractor.extract_buff_url(page)
+                buff_url = found_buff
                 if not buff_url:
                     logger.warning("buff_url_not_found", name=item["item_name"])
 
             if not steam_url:
-                steam_url = await self.steam_extractor.extract_steam_url(page)
+                steam_url = found_steam
                 if not steam_url:
                     logger.warning("steam_url_not_found", name=item["item_name"])
 
+        if buff_url and steam_url and item_url and self.url_cache:
+            self.url_cache.set(item_url, [buff_url, steam_url])
+
         return buff_url, steam_url
 
+    async def _fetch_platform_data(
+        self,
+        buff_page: Page,
+        steam_page: Page,
+        buff_url: str,
+        steam_url: str,
+        item: Dict,
+        worker_id: Optional[int],
+    ) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Run the BUFF and Steam fetches concurrently.
+
+        BUFF waits for the Steam price before its trade history, so an item
+        that cannot be profitable skips that step. The item is discarded
+        without Steam data when BUFF fails validation or has too few listings,
+        so the Steam fetch is cancelled as soon as BUFF settles either outcome.
+        """
+        steam_task = asyncio.create_task(
+            self.steam_extractor.extract_steam_data(
+                steam_page,
+                steam_url,
+                item["item_name"],
+                worker_id=worker_id,
+                http_client=self.http_client,
+            )
+        )
+
+        async def steam_price() -> Optional[float]:
+            try:
+                # Shielded: a cancelled BUFF fetch must not cancel Steam too
+                steam_data = await asyncio.shield(steam_task)
+            except Exception:
+                return None
+            return steam_data.get("avg_price") if steam_data else None
+
+        buff_data = None
+        try:
+            buff_data = await self.buff_extractor.extract_buff_data(
+                buff_page,
+                buff_url,
+                item["item_name"],
+                worker_id=worker_id,
+                steam_price=steam_price,
+            )
+        finally:
+            if not self._buff_passes(buff_data):
+                steam_task.cancel()
+                # Let the cancellation finish so the Steam page is idle again
+                await asyncio.gather(steam_task, return_exceptions=True)
+
+        if not self._buff_passes(buff_data):
+            return buff_data, None
+        return buff_data, await steam_task
+
+    def _buff_passes(self, buff_data: Optional[Dict]) -> bool:
+        """Whether BUFF data leaves the item worth a Steam lookup."""
+        return bool(buff_data) and buff_data.get("total_volume", 0) >= self.min_volume
+
     def _calculate_profitability(
         self, buff_data: dict, steam_data: dict
     ) -> Optional[dict]:
@@ -3,81 +3,102 @@ Item extractor with real CSS selectors from production.
 Parses and structures item data from HTML table.
 """
 
-import asyncio
+import json
 import re
-from datetime import datetime, timezone
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 from typing import List, Optional, Dict
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
 from app.core.logger import get_logger
+from app.core.constants import ITEM_TABLE_LOAD_TIMEOUT, ITEM_TABLE_FALLBACK_WAIT
+from app.services.utils.file_saver import FileSaver
 
 logger = get_logger(__name__)
 
+# Production selector for steamdt.com table rows
+TABLE_ROW_SELECTOR = ".el-table__body .el-table__row"
+
+# Trailing "(Quality)" of an item name, e.g. "AK-47 | Redline (Field-Tested)"
+QUALITY_SUFFIX_RE = re.compile(r"\s*\(([^)]+)\)$")
+
+# Reads every row in a single round-trip (no per-row/per-cell protocol calls)
+# and returns a JSON string, skipping Playwright's per-object serializer.
+# Only DOM reads (textContent, attributes), nothing that forces a layout.
+# /en/hanging STRUCTURE: 6+ columns
+# 0: Ranking
+# 1: Item name + URL
+# 2: BUFF - Buy price + time + LINK
+# 3: STEAM - Sell price + time + LINK
+# 4: Net sell price
+# 5: Volume/Sales
+# 6: Buy/sell ratio
+# 7: Second ratio
+# 8: Actions
+EXTRACT_ROWS_JS = """
+(selector) => JSON.stringify(Array.from(document.querySelectorAll(selector)).map((row) => {
+    const cells = row.querySelectorAll("td");
+    if (cells.length < 6) {
+        return { cell_count: cells.length };
+    }
+    const nameLink = cells[1].querySelector("a");
+    const buffLink = cells[2].querySelector('a[href*="buff.163.com"]');
+    const steamLink = cells[3].querySelector(
+        'a[href*="steamcommunity.com/market/listings"]'
+    );
+    return {
+        cell_count: cells.length,
+        name: nameLink
+            ? (nameLink.textContent || "").replace(/\\s+/g, " ").trim()
+            : "",
+        href: nameLink ? nameLink.href || null : null,
+        buff_url: buffLink ? buffLink.getAttribute("href") : null,
+        steam_url: steamLink ? steamLink.getAttribute("href") : null,
+    };
+}))
+"""
+
 
 class ItemExtractor:
     """Extracts and parses items from result table with production selectors."""
 
-    def __init__(self):
-        pass
+    def __init__(self, file_saver: Optional[FileSaver] = None):
+        self.file_saver = file_saver
 
     async def extract_items(
         self, page: Page, url: str, limit: Optional[int] = None
     ) -> List[Dict]:
         """Extract items from the table, optionally limiting the number of results."""
         items: List[Dict] = []
-        timestamp = datetime.now(timezone.utc)
 
         try:
-            # Wait briefly for table to render (selector is ambiguous with 201+ elements)
-            await page.wait_for_timeout(2000)
+            # Wait until the first row is attached instead of a fixed sleep
+            try:
+                await page.wait_for_selector(
+                    TABLE_ROW_SELECTOR,
+                    state="attached",
+                    timeout=ITEM_TABLE_LOAD_TIMEOUT,
+                )
+            except PlaywrightTimeout:
+                logger.warning("table_rows_wait_timeout")
+                await page.wait_for_timeout(ITEM_TABLE_FALLBACK_WAIT)
             logger.info("analyzing_page_structure")
 
-            # Get HTML for analysis
-            content = await page.content()
-
-            # Attempt to extract data from multiple possible structures
+            # Extract all rows in a single evaluate call
             rows = await self._find_table_rows(page)
 
             logger.info("found_rows", count=len(rows))
 
-            # PARALLELIZE ITEM EXTRACTION
-            logger.info("extracting_items_parallel")
-
-            # Apply limit if specified
-            rows_to_process = rows[:limit] if limit else rows
-            logger.info(
-                "processing_limited_rows",
-                total=len(rows),
-                processing=len(rows_to_process),
-            )
-
-            # Create parallel tasks to process all rows
-            tasks = [
-                self._extract_single_item(row, idx, timestamp)
-                for idx, row in enumerate(rows_to_process)
-            ]
-
-            # Execute all tasks in parallel
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Filter valid results
-            valid_item_count = 0
-            for idx, result in enumerate(results):
-                # If exception occurred, log and continue
-                if isinstance(result, Exception):
-                    logger.warning(
-                        "extraction_error", item_index=idx, error=str(result)
-                    )
-                    continue
-
-                # If item is valid, add it
-                if result:
-                    valid_item_count += 1
-                    items.append(result)
+            items = self.parse_rows(rows, limit=limit)
 
             # If no items found, save snapshot for debugging
             if len(items) == 0:
                 logger.warning("no_items_found_check_selectors")
+                if self.file_saver:
+                    await self.file_saver.save_empty_result_snapshot(page)
 
         except Exception as e:
             logger.error("extraction_failed", error=str(e))
@@ -85,197 +106,102 @@ class ItemExtractor:
 
         return items
 
-    async def _find_table_rows(self, page: Page):
-        """Find table rows using production selector for steamdt.com."""
-        # More specific selector for steamdt.com - only visible rows
-        selector = ".el-table__body .el-table__row"
-
+    async def _find_table_rows(self, page: Page) -> List[Dict]:
+        """Read raw row data for steamdt.com in one page.evaluate call."""
         try:
-            # Get ONLY rows that are visible in the viewport
-            rows = await page.locator(selector).all()
+            rows_json = await page.evaluate(EXTRACT_ROWS_JS, TABLE_ROW_SELECTOR)
+            rows = orjson.loads(rows_json) if orjson else json.loads(rows_json)
 
             # Filter only those with valid content (at least 6 cells - /en/hanging structure)
             valid_rows = []
             for idx, row in enumerate(rows):
-                cells = await row.locator("td").all()
-                if (
-                    len(cells) >= 6
-                ):  # /en/hanging structure: ranking, item, buff, steam, net price, volume, etc.
+                if row["cell_count"] >= 6:
                     valid_rows.append(row)
                 elif idx < 5:  # Debug: first 5 rows
                     logger.debug(
                         "row_discarded_insufficient_cells",
                         row_index=idx,
-                        cell_count=len(cells),
+                        cell_count=row["cell_count"],
                     )
 
             logger.info(
                 "selector_results",
-                selector=selector,
+                selector=TABLE_ROW_SELECTOR,
                 total_rows=len(rows),
                 valid_rows=len(valid_rows),
             )
 
-            # If no valid rows, try with alternative selector
-            if len(valid_rows) == 0 and len(rows) > 0:
-                logger.warning("no_valid_rows_trying_unfiltered")
-                # Try directly with rows without filtering by cell count
-                valid_rows = rows
-
             return valid_rows
 
         except Exception as e:
             logger.error("row_search_failed", error=str(e))
             return []
 
-    async def _extract_single_item(
-        self, row, idx: int, timestamp: datetime
-    ) -> Optional[Dict]:
-        """Extract a single item from a table row."""
-        try:
-            # Extract all cells (td) from row
-            cells = await row.locator("td").all()
-
-            # /en/hanging STRUCTURE: 6+ columns
-            # 0: Ranking
-            # 1: Item name + URL
-            # 2: BUFF - Buy price + time + LINK
-            # 3: STEAM - Sell price + time + LINK
-            # 4: Net sell price
-            # 5: Volume/Sales
-            # 6: Buy/sell ratio
-            # 7: Second ratio
-            # 8: Actions
-
-            if len(cells) < 6:
-                if idx < 3:  # Debug: first 3 rows
-                    logger.debug(
-                        "insufficient_cells", row_index=idx, cell_count=len(cells)
-                    )
-                return None
-
-            # Extract name and URL
-            item_data = await self._extract_item_name_and_url(cells, idx)
-            if not item_data:
-                if idx < 3:
-                    logger.debug("name_extraction_failed", row_index=idx)
-                return None
-
-            item_name, item_url, item_quality, is_stattrak = item_data
+    def parse_rows(self, rows: List[Dict], limit: Optional[int] = None) -> List[Dict]:
+        """Parse raw row data into items.
+
+        Pure Python with no page access, so saved evaluate output can be
+        replayed offline.
+        """
+        # Apply limit if specified
+        rows_to_process = rows[:limit] if limit else rows
+        logger.info(
+            "processing_limited_rows",
+            total=len(rows),
+            processing=len(rows_to_process),
+        )
+
+        items = [
+            item for item in map(self._parse_row, rows_to_process) if item is not None
+        ]
+        logger.info(
+            "rows_parsed",
+            items=len(items),
+            skipped=len(rows_to_process) - len(items),
+        )
+        return items
 
-            # VALIDATION FILTERS
+    def _parse_row(self, row: Dict) -> Optional[Dict]:
+        """Build a single item from raw row data, or None if it is filtered out."""
+        item_name = row.get("name")
+        if not item_name or not self._is_valid_item_name(item_name):
+            return None
 
+        # Detect StatTrak™ (the lowercase check also matches "StatTrak™")
+        is_stattrak = "stattrak" in item_name.lower()
+
+        # Extract quality (everything in parentheses at the end)
+        item_quality = None
+        quality_match = QUALITY_SUFFIX_RE.search(item_name)
+        if quality_match:
+            item_quality = quality_match.group(1)
+            # Remove quality from item name
+            item_name = item_name[: quality_match.start()].strip()
+
+        # Return simple dict (no Pydantic overhead)
+        return {
+            "item_name": item_name,
+            "quality": item_quality,
+            "stattrak": is_stattrak,
+            "url": row.get("href"),
+            "buff_url": row.get("buff_url"),
+            "steam_url": row.get("steam_url"),
+        }
+
+    @staticmethod
+    def _is_valid_item_name(item_name: str) -> bool:
+        """Apply validation filters to a raw item name."""
+        lower_name = item_name.lower()
+        return (
             # 1. IGNORE STICKERS
-            if item_name.lower().startswith("sticker"):
-                logger.debug("skipping_sticker", name=item_name)
-                return None
-
+            not lower_name.startswith("sticker")
             # 2. IGNORE MUSIC KITS
-            if "music kit" in item_name.lower():
-                logger.debug("skipping_music_kit", name=item_name)
-                return None
-
+            and "music kit" not in lower_name
             # 3. MUST CONTAIN | (pipes) to be valid weapon/skin
             # This excludes: pins, cases, keys, patches, etc.
-            if "|" not in item_name:
-                logger.debug("skipping_no_pipe", name=item_name)
-                return None
-
+            and "|" in item_name
             # 4. IGNORE CHARMS
-            if item_name.startswith("Charm |"):
-                logger.debug("skipping_charm", name=item_name)
-                return None
-
+            and not item_name.startswith("Charm |")
             # 5. IGNORE PATCHES
-            if item_name.startswith("Patch |"):
-                logger.debug("skipping_patch", name=item_name)
-                return None
-
-            # Extract BUFF and Steam URLs from row (available in /en/hanging)
-            buff_url = await self._extract_platform_url(cells, 2, "buff.163.com")
-            steam_url = await self._extract_platform_url(
-                cells, 3, "steamcommunity.com/market/listings"
-            )
-
-            # Return simple dict (no Pydantic overhead)
-            return {
-                "item_name": item_name,
-                "quality": item_quality,
-                "stattrak": is_stattrak,
-                "url": item_url,
-                "buff_url": buff_url,
-                "steam_url": steam_url,
-            }
-
-        except Exception as e:
-            if idx < 3:
-                logger.debug("row_processing_error", row_index=idx, error=str(e))
-            return None
-
-    async def _extract_item_name_and_url(self, cells, idx: int):
-        """Extract item name, URL, quality, and StatTrak status."""
-        try:
-            name_cell = cells[1] if len(cells) > 1 else None
-            if not name_cell:
-                return None
-
-            # Find <a> link containing full name - use multiple selectors
-            name_link_element = name_cell.locator("a").first
-
-            # Try inner_text first (more reliable for /en/hanging)
-            item_name = await name_link_element.inner_text()
-            if not item_name or len(item_name.strip()) == 0:
-                # Fallback to text_content
-                item_name = await name_link_element.text_content()
-
-            item_name = item_name.strip()
-
-            # Skip if name extraction failed
-            if not item_name or len(item_name) == 0:
-                logger.debug("empty_name_extracted", row_index=idx)
-                return None
-
-            # Extract item URL
-            item_url = await name_link_element.get_attribute("href")
-            if item_url and not item_url.startswith("http"):
-                item_url = f"https://steamdt.com{item_url}"
-
-            # Detect StatTrak™
-            is_stattrak = "StatTrak™" in item_name or "stattrak" in item_name.lower()
-
-            # Extract quality (everything in parentheses at the end)
-            item_quality = None
-            quality_match = re.search(r"\(([^)]+)\)$", item_name)
-            if quality_match:
-                item_quality = quality_match.group(1)
-                # Remove quality from item name
-                item_name = re.sub(r"\s*\([^)]+\)$", "", item_name).strip()
-
-            return (item_name, item_url, item_quality, is_stattrak)
-
-        except Exception as e:
-            logger.debug("name_extraction_error", row_index=idx, error=str(e))
-            return None
-
-    async def _extract_platform_url(
-        self, cells, cell_idx: int, url_pattern: str
-    ) -> Optional[str]:
-        """Extract platform URL from specific cell."""
-        try:
-            cell = cells[cell_idx] if len(cells) > cell_idx else None
-            if not cell:
-                return None
-
-            # Find <a> link containing URL pattern
-            link = cell.locator(f'a[href*="{url_pattern}"]').first
-            url = await link.get_attribute("href")
-            return url
-
-        except Exception as e:
-            logger.debug(
-                "url_extraction_error",
-                cell_index=cell_idx,
-                pattern=url_pattern,
-                error=str(e),
-            )
-            return None
+            and not item_name.startswith("Patch |")
+        )
@@ -3,32 +3,54 @@ Steam extractor - Specialized extractor for Steam Market data.
 """
 
 import re
+import httpx
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
-from typing import Optional, List, Dict
+from contextlib import nullcontext
+from typing import AsyncContextManager, Optional, List, Dict
 from app.core.logger import get_logger
-from app.core.constants import STEAM_MAX_LISTINGS, PAGE_WAIT_DYNAMIC_CONTENT
+from app.core.constants import (
+    STEAM_MAX_LISTINGS,
+    STEAM_RENDER_CURRENCY,
+    STEAM_EUR_CURRENCY_ID,
+)
 from app.domain.rules import convert_cny_to_eur
+from app.services.utils.rate_limiter import HostRateLimiter
 
 logger = get_logger(__name__)
 
+STEAM_LISTING_ROW_SELECTOR = "#searchResultsRows .market_listing_row"
+
+# Everything that is not part of the number: currency symbols, spaces, commas
+NON_PRICE_CHARS_RE = re.compile(r"[^\d.]")
+NON_DIGITS_RE = re.compile(r"\D")  # Thousands separators in counters
+
+# Trimmed text of the first match, or "" when nothing matches
+FIRST_TEXT_JS = "(els) => (els.length ? els[0].textContent.trim() : '')"
+
+# Price text of the first listing rows, read in one evaluate call.
+# textContent instead of innerText: innerText forces a layout per row
+LISTING_PRICES_JS = """
+(rows, limit) => rows.slice(0, limit).map((row) => {
+    const price = row.querySelector(".market_listing_price");
+    return price ? price.textContent.trim() : "0";
+})
+"""
+
 
 class SteamExtractor:
     """Handles all Steam Market-specific extraction logic."""
 
-    def __init__(self, timeout: int = 10000):
+    def __init__(
+        self, timeout: int = 10000, rate_limiter: Optional[HostRateLimiter] = None
+    ):
         self.timeout = timeout  # 10s timeout for Steam
+        self.rate_limiter = rate_limiter
 
-    async def extract_steam_url(self, page: Page) -> Optional[str]:
-        """Extract Steam Market URL from SteamDT item page."""
-        try:
-            steam_links = await page.query_selector_all(
-                'a[href*="steamcommunity.com/market"]'
-            )
-            if steam_links:
-                return await steam_links[0].get_attribute("href")
-        except Exception as e:
-            logger.error("steam_url_extraction_error", error=str(e))
-        return None
+    def _throttle(self, url: str) -> AsyncContextManager[None]:
+        """Pace and time a request with the shared per-host limiter, if any."""
+        if self.rate_limiter:
+            return self.rate_limiter.throttle(url)
+        return nullcontext()
 
     async def extract_steam_data(
         self,
@@ -36,30 +58,50 @@ class SteamExtractor:
         steam_url: str,
         item_name: str,
         worker_id: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> Optional[dict]:
         """Extract complete Steam Market data."""
-        try:
-            await page.goto(steam_url, wait_until="networkidle", timeout=self.timeout)
-            await page.wait_for_timeout(PAGE_WAIT_DYNAMIC_CONTENT)
+        # JSON first: the shared HTTP client, or else the page's own request
+        # context (same cookies, nothing rendered); the page is the fallback
+        if http_client:
+            steam_data = await self.fetch_steam_data_http(
+                http_client, steam_url, item_name, worker_id=worker_id
+            )
+        else:
+            steam_data = await self.fetch_steam_data_api(
+                page, steam_url, item_name, worker_id=worker_id
+            )
+        if steam_data:
+            return steam_data
 
-            # Get total volume from Steam's counter
-            total_volume = 0
+        try:
+            async with self._throttle(steam_url):
+                await page.goto(
+                    steam_url, wait_until="domcontentloaded", timeout=self.timeout
+                )
+            # Gate on the listings themselves instead of network idle + sleep
             try:
-                total_elem = await page.query_selector("#searchResults_total")
-                if total_elem:
-                    total_text = await total_elem.inner_text()
-                    total_volume = int(total_text.strip())
-                    logger.info(
-                        "steam_total_volume_found",
-                        worker_id=worker_id,
-                        total=total_volume,
-                    )
-            except Exception as e:
-                logger.warning(
-                    "steam_total_volume_extraction_failed",
+                await page.wait_for_selector(
+                    STEAM_LISTING_ROW_SELECTOR, timeout=self.timeout
+                )
+            except PlaywrightTimeout:
+                logger.warning("steam_listing_rows_wait_timeout", worker_id=worker_id)
+
+            # Get total volume from Steam's counter; a missing or empty counter
+            # is the common case on slow pages, so check instead of raising
+            total_text = await page.eval_on_selector_all(
+                "#searchResults_total", FIRST_TEXT_JS
+            )
+            total_digits = NON_DIGITS_RE.sub("", total_text)
+            total_volume = int(total_digits) if total_digits else 0
+            if total_volume:
+                logger.debug(
+                    "steam_total_volume_found",
                     worker_id=worker_id,
-                    error=str(e),
+                    total=total_volume,
                 )
+            else:
+                logger.warning("steam_total_volume_not_found", worker_id=worker_id)
 
             # Extract selling items
             selling_items = await self.extract_selling_items(page)
@@ -68,14 +110,9 @@ class SteamExtractor:
                 logger.warning("no_steam_listings", item=item_name)
                 return None
 
-            # Calculate averages
-            avg_price = (
-                sum(float(item["price"]) for item in selling_items) / len(selling_items)
-                if selling_items
-                else 0.0
-            )
-
-            lowest_price = min((float(i["price"]) for i in selling_items), default=0.0)
+            prices = [item["price_eur"] for item in selling_items]
+            avg_price = sum(prices) / len(prices)
+            lowest_price = min(prices)
 
             return {
                 "platform": "Steam",
@@ -93,6 +130,134 @@ class SteamExtractor:
             logger.error("steam_extraction_error", error=str(e), url=steam_url)
             return None
 
+    async def fetch_steam_data_http(
+        self,
+        http_client: httpx.AsyncClient,
+        steam_url: str,
+        item_name: str,
+        worker_id: Optional[int] = None,
+    ) -> Optional[dict]:
+        """Read listings from Steam's render endpoint without opening a page.
+
+        Returns None whenever the response is not usable so the caller can
+        fall back to the browser.
+        """
+        request = self._render_request(steam_url)
+        if not request:
+            return None
+
+        try:
+            async with self._throttle(request[0]):
+                response = await http_client.get(request[0], params=request[1])
+            response.raise_for_status()
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug("steam_http_fallback", worker_id=worker_id, error=str(e))
+            return None
+
+        return self._parse_render_data(data, item_name, worker_id)
+
+    async def fetch_steam_data_api(
+        self,
+        page: Page,
+        steam_url: str,
+        item_name: str,
+        worker_id: Optional[int] = None,
+    ) -> Optional[dict]:
+        """Same as fetch_steam_data_http, through the page's APIRequestContext."""
+        request = self._render_request(steam_url)
+        if not request:
+            return None
+
+        try:
+            async with self._throttle(request[0]):
+                response = await page.request.get(
+                    request[0], params=request[1], timeout=self.timeout
+                )
+            if not response.ok:
+                logger.debug(
+                    "steam_api_fallback", worker_id=worker_id, status=response.status
+                )
+                return None
+            data = await response.json()
+        except Exception as e:
+            logger.debug("steam_api_fallback", worker_id=worker_id, error=str(e))
+            return None
+
+        return self._parse_render_data(data, item_name, worker_id)
+
+    @staticmethod
+    def _render_request(steam_url: str) -> Optional[tuple[str, Dict]]:
+        """URL and query for the JSON listings of a market listing page."""
+        if "steamcommunity.com/market/listings/" not in steam_url:
+            return None
+
+        render_url = steam_url.split("#")[0].split("?")[0].rstrip("/") + "/render/"
+        params = {
+            "start": 0,
+            "count": STEAM_MAX_LISTINGS,
+            "currency": STEAM_RENDER_CURRENCY,
+            "language": "english",
+            "format": "json",
+        }
+        return render_url, params
+
+    @staticmethod
+    def _parse_render_data(
+        data: Dict, item_name: str, worker_id: Optional[int]
+    ) -> Optional[dict]:
+        """Build Steam data from a render payload, or None if it is unusable."""
+        if not data.get("success"):
+            return None
+
+        selling_items = []
+        for listing in (data.get("listinginfo") or {}).values():
+            # Buyer price is price + fee; only EUR amounts are comparable
+            if listing.get("converted_currencyid") == STEAM_EUR_CURRENCY_ID:
+                cents = listing.get("converted_price", 0) + listing.get(
+                    "converted_fee", 0
+                )
+            elif listing.get("currencyid") == STEAM_EUR_CURRENCY_ID:
+                cents = listing.get("price", 0) + listing.get("fee", 0)
+            else:
+                continue
+
+            if cents > 0:
+                selling_items.append(
+                    {
+                        "price": str(cents / 100),
+                        "price_eur": cents / 100,
+                        "quantity": 1,
+                        "platform": "Steam",
+                        "currency": "EUR",
+                    }
+                )
+
+        if not selling_items:
+            return None
+
+        selling_items.sort(key=lambda i: i["price_eur"])
+        selling_items = selling_items[:STEAM_MAX_LISTINGS]
+        prices = [i["price_eur"] for i in selling_items]
+        total_volume = int(data.get("total_count") or 0)
+
+        logger.debug(
+            "steam_http_fast_path",
+            worker_id=worker_id,
+            item=item_name,
+            listings=len(selling_items),
+            total=total_volume,
+        )
+
+        return {
+            "platform": "Steam",
+            "avg_price": sum(prices) / len(prices),
+            "lowest_price": min(prices),
+            "selling_items": selling_items,
+            "volume_24h": len(selling_items),  # Approximation
+            "total_volume": total_volume,  # Total listings available
+        }
+
     async def extract_selling_items(self, page: Page) -> List[Dict]:
         """Extract current Steam Market listings."""
         selling_items = []
@@ -101,34 +266,33 @@ class SteamExtractor:
             # Wait for listings section
             await page.wait_for_selector("#searchResultsRows", timeout=5000)
 
-            # Extract listing rows
-            rows = await page.query_selector_all(
-                "#searchResultsRows .market_listing_row"
+            # Cheapest listing prices in a single round-trip
+            price_texts = await page.eval_on_selector_all(
+                STEAM_LISTING_ROW_SELECTOR,
+                LISTING_PRICES_JS,
+                STEAM_MAX_LISTINGS,
             )
 
-            for row in rows[:STEAM_MAX_LISTINGS]:  # Get cheapest listings for average
+            for price_text in price_texts:
                 try:
-                    # Price
-                    price_elem = await row.query_selector(".market_listing_price")
-                    price_text = await price_elem.inner_text() if price_elem else "0"
-
                     # Detect currency and convert if needed
                     is_cny = "¥" in price_text or "￥" in price_text
 
                     # Clean price (remove currency symbols, whitespace)
-                    price_raw = re.sub(r"[^\d.]", "", price_text)
+                    price_raw = NON_PRICE_CHARS_RE.sub("", price_text)
+                    price_value = float(price_raw) if price_raw else 0.0
 
-                    if price_raw and float(price_raw) > 0:
+                    if price_value > 0:
                         # Convert CNY to EUR if needed
                         if is_cny:
-                            price_eur = convert_cny_to_eur(float(price_raw))
+                            price_eur = convert_cny_to_eur(price_value)
                             logger.debug(
                                 "steam_price_converted",
-                                cny=f"¥{price_raw}",
-                                eur=f"€{price_eur:.2f}",
+                                cny=price_raw,
+                                eur=round(price_eur, 2),
                             )
                         else:
-                            price_eur = float(price_raw)
+                            price_eur = price_value
 
                         # Quantity (usually 1 per listing on Steam)
                         quantity = 1
@@ -136,6 +300,7 @@ class SteamExtractor:
                         selling_items.append(
                             {
                                 "price": str(price_eur),
+                                "price_eur": price_eur,
                                 "quantity": quantity,
                                 "platform": "Steam",
                                 "currency": "CNY" if is_cny else "EUR",
@@ -3,25 +3,131 @@ Filter manager for web scraping configuration.
 Manages all search filter configuration on the web interface.
 """
 
-from playwright.async_api import Page
-from typing import Optional
+import asyncio
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeout
+from typing import Dict, Optional
 
 from app.core.logger import get_logger
 from app.core.config import Settings
+from app.core.constants import (
+    FILTER_CURRENCY_RELOAD_WAIT,
+    FILTER_MODAL_APPEAR_TIMEOUT,
+    FILTER_MODAL_HIDE_TIMEOUT,
+    FILTER_SEARCH_EXECUTE_WAIT,
+    FILTER_UI_TIMEOUT,
+)
 
 logger = get_logger(__name__)
 
+# Platform checkboxes: (label, settings attribute, checkbox selector)
+PLATFORM_CHECKBOXES = tuple(
+    (platform, attr_name, f'.el-checkbox:has-text("{platform}")')
+    for platform, attr_name in (
+        ("C5GAME", "platform_c5game"),
+        ("UU", "platform_uu"),
+        ("BUFF", "platform_buff"),
+    )
+)
+ANY_PLATFORM_CHECKBOX_SELECTOR = ", ".join(s for _, _, s in PLATFORM_CHECKBOXES)
+# State of every platform checkbox in one call, in label order: null if
+# missing, otherwise whether it is checked. Case-insensitive substring match
+# like Playwright's :has-text()
+PLATFORM_STATES_JS = """
+(labels) => {
+    const boxes = Array.from(document.querySelectorAll(".el-checkbox"));
+    return labels.map((label) => {
+        const box = boxes.find((b) =>
+            (b.textContent || "").toLowerCase().includes(label.toLowerCase())
+        );
+        const input = box ? box.querySelector('input[type="checkbox"]') : null;
+        return input ? input.checked : null;
+    });
+}
+"""
+
+# Modal close buttons (puede ser en chino o inglés), matched in one query
+MODAL_CLOSE_SELECTOR = ", ".join(
+    (
+        'button:has-text("我已知晓")',  # Chino
+        'button:has-text("I understand")',  # Inglés
+        ".el-dialog__close",  # Botón X
+        'button.el-button:has-text("OK")',
+    )
+)
+
+# Candidate selectors for the currency dropdown, in priority order
+CURRENCY_DROPDOWN_SELECTORS = (
+    ".el-dropdown-link",
+    "[class*='currency']",
+    "[class*='dropdown']",
+)
+CURRENCY_OPTION_SELECTOR = 'li:has-text("{}")'
+TAB_SELECTOR = '.tabs-item:has-text("{}")'
+ACTIVE_TAB_SELECTOR = '.tabs-item.active:has-text("{}")'
+FILTER_INPUT_SELECTOR = ".el-input__inner:not(#searchInput)"
+
+# Tab state in one call: null if missing, otherwise whether it is active
+TAB_STATE_JS = """
+(tabs) => tabs.length ? tabs[0].classList.contains("active") : null
+"""
+
+# Fills inputs by position in one call and fires the events Vue listens to;
+# null values are left untouched
+FILL_INPUTS_JS = """
+({ selector, values }) => {
+    const inputs = document.querySelectorAll(selector);
+    let filled = 0;
+    values.forEach((value, i) => {
+        if (value === null || i >= inputs.length) {
+            return;
+        }
+        inputs[i].value = value;
+        inputs[i].dispatchEvent(new Event("input", { bubbles: true }));
+        inputs[i].dispatchEvent(new Event("change", { bubbles: true }));
+        filled += 1;
+    });
+    return { found: inputs.length, filled };
+}
+"""
+
+# Returns the first selector (plain CSS) that matches any element, or null
+FIRST_MATCHING_SELECTOR_JS = """
+(selectors) => selectors.find((s) => document.querySelector(s) !== null) || null
+"""
+
 
 class FilterManager:
     """Manages search filter configuration on scraping page."""
 
     def __init__(self, settings: Settings):
         self.settings = settings
+        # Locators per page, kept only while configure_all_filters runs on it:
+        # the page is alive then, so its id() cannot be reused by another page
+        self._locator_caches: Dict[int, Dict[str, Locator]] = {}
+
+    def _locator(self, page: Page, selector: str) -> Locator:
+        """Get a cached locator for selector on page."""
+        cache = self._locator_caches.get(id(page))
+        if cache is None:
+            return page.locator(selector)
+        locator = cache.get(selector)
+        if locator is None:
+            locator = cache[selector] = page.locator(selector)
+        return locator
 
     async def configure_all_filters(self, page: Page):
         """Configure all search filters."""
         logger.info("configuring_search_filters")
 
+        self._locator_caches[id(page)] = {}
+        try:
+            await self._configure_filters(page)
+        finally:
+            self._locator_caches.pop(id(page), None)
+
+        logger.info("filter_configuration_completed")
+
+    async def _configure_filters(self, page: Page):
         # La página /en/hanging tiene TODOS los filtros disponibles
         # Configurar en el orden correcto:
 
@@ -31,14 +137,14 @@ class FilterManager:
         # 2. Configure currency
         await self._configure_currency(page)
 
-        # 3. Configure sell mode
-        await self._configure_sell_mode(page)
-
-        # 4. Configure buy mode (if applicable)
-        await self._configure_buy_mode(page)
-
-        # 5. Configure balance type
-        await self._configure_balance_type(page)
+        # 3-5. Sell mode, buy mode and balance type tabs are independent,
+        # configure them concurrently to overlap their waits.
+        # Currency stays sequential: its dropdown closes on any outside click.
+        await asyncio.gather(
+            self._configure_sell_mode(page),
+            self._configure_buy_mode(page),
+            self._configure_balance_type(page),
+        )
 
         # 6. Configure price and volume filters
         await self._configure_price_volume_filters(page)
@@ -49,29 +155,26 @@ class FilterManager:
         # 8. Execute search
         await self._execute_search(page)
 
-        logger.info("filter_configuration_completed")
-
     async def _close_modal(self, page: Page):
         """Close initial modal if it appears."""
         try:
             logger.info("checking_for_modal")
-            # Buscar botón de cerrar modal (puede ser en chino o inglés)
-            close_selectors = [
-                'button:has-text("我已知晓")',  # Chino
-                'button:has-text("I understand")',  # Inglés
-                ".el-dialog__close",  # Botón X
-                'button.el-button:has-text("OK")',
-            ]
-
-            for selector in close_selectors:
-                close_button = page.locator(selector).first
-                if await close_button.count() > 0:
-                    await close_button.click()
-                    await page.wait_for_timeout(500)  # Reduced from 1000ms
-                    logger.info("modal_closed", selector=selector)
-                    return
+            # Buscar botón de cerrar modal con un único selector compuesto
+            close_button = self._locator(page, MODAL_CLOSE_SELECTOR).first
+            try:
+                await close_button.wait_for(
+                    state="visible", timeout=FILTER_MODAL_APPEAR_TIMEOUT
+                )
+            except PlaywrightTimeout:
+                logger.info("no_modal_found")
+                return
 
-            logger.info("no_modal_found")
+            await close_button.click()
+            # Wait for the modal to actually go away instead of a fixed sleep
+            await close_button.wait_for(
+                state="hidden", timeout=FILTER_MODAL_HIDE_TIMEOUT
+            )
+            logger.info("modal_closed")
         except Exception as e:
             logger.warning("modal_close_failed", error=str(e))
 
@@ -88,42 +191,51 @@ class FilterManager:
         try:
             logger.info("changing_currency", target=currency_code)
 
-            # Wait for page to load completely
-            await page.wait_for_timeout(500)
-
             # Find currency selector (puede ser .el-dropdown-link o similar)
-            # Probar múltiples selectores
-            selectors = [
-                ".el-dropdown-link",
-                "[class*='currency']",
-                "[class*='dropdown']",
-            ]
-
+            # Probar múltiples selectores en una sola llamada, hasta que exista
             currency_selector = None
-            for selector in selectors:
-                locator = page.locator(selector).first
-                if await locator.count() > 0:
-                    currency_selector = locator
-                    logger.info("currency_selector_found", selector=selector)
-                    break
+            try:
+                handle = await page.wait_for_function(
+                    FIRST_MATCHING_SELECTOR_JS,
+                    arg=list(CURRENCY_DROPDOWN_SELECTORS),
+                    timeout=FILTER_UI_TIMEOUT,
+                )
+                selector = await handle.json_value()
+            except PlaywrightTimeout:
+                selector = None
+            if selector:
+                currency_selector = self._locator(page, selector).first
+                logger.info("currency_selector_found", selector=selector)
 
             if currency_selector:
                 # Click on currency dropdown
                 await currency_selector.click()
-                await page.wait_for_timeout(300)
 
-                # Find and click desired currency
-                currency_option = page.locator(f'li:has-text("{currency_code}")')
+                # Find and click desired currency once the dropdown shows it
+                currency_option = self._locator(
+                    page, CURRENCY_OPTION_SELECTOR.format(currency_code)
+                ).first
+                try:
+                    await currency_option.wait_for(
+                        state="visible", timeout=FILTER_UI_TIMEOUT
+                    )
+                    option_found = True
+                except PlaywrightTimeout:
+                    option_found = False
 
-                if await currency_option.count() > 0:
-                    await currency_option.first.click()
+                if option_found:
+                    await currency_option.click()
                     logger.info("currency_changed", currency=currency_code)
-                    await page.wait_for_timeout(1000)  # Wait for prices to reload
+                    # Prices reload from the server with no DOM marker to wait on
+                    await page.wait_for_timeout(FILTER_CURRENCY_RELOAD_WAIT)
                 else:
                     logger.warning("currency_option_not_found", currency=currency_code)
                     await page.keyboard.press("Escape")
             else:
-                logger.warning("currency_selector_not_found", tried_selectors=selectors)
+                logger.warning(
+                    "currency_selector_not_found",
+                    tried_selectors=CURRENCY_DROPDOWN_SELECTORS,
+                )
 
         except Exception as e:
             logger.warning("currency_change_failed", error=str(e))
@@ -136,15 +248,14 @@ class FilterManager:
             sell_mode = getattr(self.settings, "sell_mode", "Lowest Price")
             logger.info("checking_sell_mode", mode=sell_mode)
 
-            sell_tab = page.locator(f'.tabs-item:has-text("{sell_mode}")')
-            if await sell_tab.count() > 0:
-                tab_class = await sell_tab.first.get_attribute("class")
-                if "active" not in tab_class:
-                    await sell_tab.first.click()
-                    await page.wait_for_timeout(300)
-                    logger.info("sell_mode_selected", mode=sell_mode)
-                else:
-                    logger.info("sell_mode_already_selected", mode=sell_mode)
+            sell_tab = self._locator(page, TAB_SELECTOR.format(sell_mode))
+            is_active = await sell_tab.evaluate_all(TAB_STATE_JS)
+            if is_active is False:
+                await sell_tab.first.click()
+                await self._wait_for_active_tab(page, sell_mode)
+                logger.info("sell_mode_selected", mode=sell_mode)
+            elif is_active:
+                logger.info("sell_mode_already_selected", mode=sell_mode)
         except Exception as e:
             logger.warning("sell_mode_configuration_error", error=str(e))
 
@@ -159,15 +270,14 @@ class FilterManager:
 
             logger.info("checking_buy_mode", mode=buy_mode)
 
-            buy_tab = page.locator(f'.tabs-item:has-text("{buy_mode}")')
-            if await buy_tab.count() > 0:
-                tab_class = await buy_tab.first.get_attribute("class")
-                if "active" not in tab_class:
-                    await buy_tab.first.click()
-                    await page.wait_for_timeout(300)
-                    logger.info("buy_mode_selected", mode=buy_mode)
-                else:
-                    logger.info("buy_mode_already_selected", mode=buy_mode)
+            buy_tab = self._locator(page, TAB_SELECTOR.format(buy_mode))
+            is_active = await buy_tab.evaluate_all(TAB_STATE_JS)
+            if is_active is False:
+                await buy_tab.first.click()
+                await self._wait_for_active_tab(page, buy_mode)
+                logger.info("buy_mode_selected", mode=buy_mode)
+            elif is_active:
+                logger.info("buy_mode_already_selected", mode=buy_mode)
         except Exception as e:
             logger.warning("buy_mode_configuration_error", error=str(e))
 
@@ -178,18 +288,23 @@ class FilterManager:
             balance_type = getattr(self.settings, "balance_type", "BUFF-STEAM")
             logger.info("checking_balance_type", type=balance_type)
 
-            balance_tab = page.locator(f'.tabs-item:has-text("{balance_type}")')
-            if await balance_tab.count() > 0:
-                tab_class = await balance_tab.first.get_attribute("class")
-                if "active" not in tab_class:
-                    await balance_tab.first.click()
-                    await page.wait_for_timeout(300)
-                    logger.info("balance_type_selected", type=balance_type)
-                else:
-                    logger.info("balance_type_already_selected", type=balance_type)
+            balance_tab = self._locator(page, TAB_SELECTOR.format(balance_type))
+            is_active = await balance_tab.evaluate_all(TAB_STATE_JS)
+            if is_active is False:
+                await balance_tab.first.click()
+                await self._wait_for_active_tab(page, balance_type)
+                logger.info("balance_type_selected", type=balance_type)
+            elif is_active:
+                logger.info("balance_type_already_selected", type=balance_type)
         except Exception as e:
             logger.warning("balance_type_configuration_error", error=str(e))
 
+    async def _wait_for_active_tab(self, page: Page, label: str):
+        """Wait until the clicked tab is marked active."""
+        await self._locator(page, ACTIVE_TAB_SELECTOR.format(label)).first.wait_for(
+            state="attached", timeout=FILTER_UI_TIMEOUT
+        )
+
     async def _configure_price_volume_filters(self, page: Page):
         """Configure price and volume filters."""
         try:
@@ -197,48 +312,31 @@ class FilterManager:
             max_price = self.settings.max_price
             min_volume = self.settings.min_volume
 
-            # Wait for elements to be ready
-            await page.wait_for_timeout(300)
-
-            # Find filter inputs (excluding general search input)
-            filter_inputs = await page.locator(
-                ".el-input__inner:not(#searchInput)"
-            ).all()
-
-            logger.info("filter_inputs_found", count=len(filter_inputs))
-
-            # Set minimum price
-            if min_price is not None and len(filter_inputs) >= 1:
-                try:
-                    logger.info("setting_min_price", value=min_price)
-                    await filter_inputs[0].fill(str(min_price), timeout=10000)
-                    logger.info("min_price_set", value=min_price)
-                except Exception as e:
-                    logger.warning("min_price_set_failed", error=str(e))
-
-            # Set maximum price
-            if max_price is not None and len(filter_inputs) >= 2:
-                try:
-                    logger.info("setting_max_price", value=max_price)
-                    await filter_inputs[1].fill(str(max_price), timeout=10000)
-                    logger.info("max_price_set", value=max_price)
-                except Exception as e:
-                    logger.warning("max_price_set_failed", error=str(e))
-
-            # Set minimum volume
-            if min_volume is not None:
-                volume_idx = 2
-                if len(filter_inputs) > volume_idx:
-                    try:
-                        logger.info("setting_min_volume", value=min_volume)
-                        await filter_inputs[volume_idx].fill(
-                            str(min_volume), timeout=10000
-                        )
-                        logger.info("min_volume_set", value=min_volume)
-                    except Exception as e:
-                        logger.warning("min_volume_set_failed", error=str(e))
+            # Find filter inputs (excluding general search input) once rendered
+            try:
+                await self._locator(page, FILTER_INPUT_SELECTOR).first.wait_for(
+                    state="attached", timeout=FILTER_UI_TIMEOUT
+                )
+            except PlaywrightTimeout:
+                pass  # Logged below as zero inputs found
+
+            # Min price, max price and min volume go in input order, all at once
+            values = [
+                None if value is None else str(value)
+                for value in (min_price, max_price, min_volume)
+            ]
+            result = await page.evaluate(
+                FILL_INPUTS_JS, {"selector": FILTER_INPUT_SELECTOR, "values": values}
+            )
 
-            await page.wait_for_timeout(300)
+            logger.info("filter_inputs_found", count=result["found"])
+            logger.info(
+                "price_volume_filters_set",
+                min_price=min_price,
+                max_price=max_price,
+                min_volume=min_volume,
+                filled=result["filled"],
+            )
         except Exception as e:
             logger.warning("price_volume_filters_configuration_error", error=str(e))
 
@@ -246,51 +344,54 @@ class FilterManager:
         """Configure platform filters."""
         try:
             logger.info("opening_platform_settings")
-            platform_settings = page.locator('.text-blue:has-text("Platform Settings")')
+            platform_settings = self._locator(
+                page, '.text-blue:has-text("Platform Settings")'
+            )
 
             if await platform_settings.count() > 0:
                 await platform_settings.first.click()
-                await page.wait_for_timeout(500)
+                checkboxes = self._locator(page, ANY_PLATFORM_CHECKBOX_SELECTOR)
+                try:
+                    await checkboxes.first.wait_for(
+                        state="visible", timeout=FILTER_UI_TIMEOUT
+                    )
+                except PlaywrightTimeout:
+                    pass  # Missing checkboxes are skipped one by one below
                 logger.info("platform_settings_opened")
 
             # Configure platforms according to settings
             logger.info("configuring_platforms")
 
-            # For each known platform, configure
-            for platform, attr_name in [
-                ("C5GAME", "platform_c5game"),
-                ("UU", "platform_uu"),
-                ("BUFF", "platform_buff"),
-            ]:
+            # Read all checkbox states in one call, then click only mismatches
+            states = await page.evaluate(
+                PLATFORM_STATES_JS, [platform for platform, _, _ in PLATFORM_CHECKBOXES]
+            )
+
+            for (platform, attr_name, selector), is_checked in zip(
+                PLATFORM_CHECKBOXES, states
+            ):
+                if is_checked is None:
+                    continue
+
                 try:
-                    checkbox = page.locator(
-                        f'.el-checkbox:has-text("{platform}")'
-                    ).first
-
-                    if await checkbox.count() > 0:
-                        input_checkbox = checkbox.locator('input[type="checkbox"]')
-
-                        is_checked = await input_checkbox.is_checked()
-                        should_be_checked = getattr(self.settings, attr_name, False)
-
-                        if is_checked != should_be_checked:
-                            await checkbox.click(timeout=5000)
-                            status = "checked" if should_be_checked else "unchecked"
-                            logger.info(
-                                "platform_configured", platform=platform, status=status
-                            )
-                        else:
-                            logger.info(
-                                "platform_already_configured",
-                                platform=platform,
-                                status="checked" if is_checked else "unchecked",
-                            )
+                    should_be_checked = getattr(self.settings, attr_name, False)
+
+                    if is_checked != should_be_checked:
+                        await self._locator(page, selector).first.click(timeout=5000)
+                        status = "checked" if should_be_checked else "unchecked"
+                        logger.info(
+                            "platform_configured", platform=platform, status=status
+                        )
+                    else:
+                        logger.info(
+                            "platform_already_configured",
+                            platform=platform,
+                            status="checked" if is_checked else "unchecked",
+                        )
                 except Exception as e:
                     logger.warning(
                         "platform_configuration_error", platform=platform, error=str(e)
                     )
-
-            await page.wait_for_timeout(300)
         except Exception as e:
             logger.warning("platforms_configuration_error", error=str(e))
 
@@ -298,14 +399,16 @@ class FilterManager:
         """Execute search with configured filters."""
         try:
             logger.info("executing_search")
-            confirm_btn = page.locator(
-                '.bg-\\[\\#0252D9\\]:has-text("Confirm and Search")'
+            confirm_btn = self._locator(
+                page, '.bg-\\[\\#0252D9\\]:has-text("Confirm and Search")'
             )
 
             if await confirm_btn.count() > 0:
                 await confirm_btn.first.click()
                 logger.info("search_initiated")
-                await page.wait_for_timeout(2000)
+                # The table keeps its old rows until results arrive, so there is
+                # no selector that marks the new results as ready
+                await page.wait_for_timeout(FILTER_SEARCH_EXECUTE_WAIT)
                 logger.info("waiting_for_results")
         except Exception as e:
             logger.warning("search_execution_error", error=str(e))
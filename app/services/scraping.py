@@ -6,6 +6,12 @@ from typing import List, Optional, Dict
 
 from app.core.logger import get_logger
 from app.core.config import Settings
+from app.core.constants import (
+    DEFAULT_NAVIGATION_TIMEOUT,
+    TARGET_NAVIGATION_TIMEOUT,
+    TARGET_READY_SELECTOR,
+    WARM_UP_URLS,
+)
 from app.domain.models import ScrapedItem
 from app.services.extractors import ItemExtractor, DetailedItemExtractor
 from app.services.filters import FilterManager
@@ -22,10 +28,10 @@ class ScrapingService:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.item_extractor = ItemExtractor()
+        self.file_saver = FileSaver(settings)
+        self.item_extractor = ItemExtractor(self.file_saver)
         self.detailed_extractor = DetailedItemExtractor(settings)
         self.filter_manager = FilterManager(settings)
-        self.file_saver = FileSaver(settings)
         self.session_manager = SessionManager()
 
     async def scrape_items(
@@ -36,7 +42,14 @@ class ScrapingService:
         exclusion_filters: Optional[List[str]] = None,
         async_storage: bool = False,
         headless: Optional[bool] = None,
+        partial_results_file: Optional[str] = None,
     ) -> tuple[List[ScrapedItem], List[Dict]]:
+        """Scrape and analyze items, streaming each result to a partial JSONL.
+
+        When partial_results_file is given the caller owns that file and
+        removes it once the final output is safely written; otherwise a per-run
+        file is used and removed when the run completes.
+        """
         scraper_workers = concurrent_workers or self.settings.max_concurrent
         db_workers = storage_workers or 2
         filters = exclusion_filters or []
@@ -59,53 +72,94 @@ class ScrapingService:
             storage_service = StorageService()
 
         use_persistent, storage_state = self.session_manager.get_browser_config()
+        # Own file per run so concurrent runs never clear or interleave another's
+        owns_partial_results = partial_results_file is None
+        if owns_partial_results:
+            partial_results_file = self.file_saver.new_partial_results_file()
+
+        # Shared HTTP client lets Steam listings skip a page navigation
+        self.detailed_extractor.open_http_client()
+        # Resolved while the browser starts; prices convert with it later
+        rate_task = asyncio.create_task(self.detailed_extractor.refresh_exchange_rate())
+        try:
+            async with BrowserManager(
+                headless=headless_mode,
+                use_persistent_context=use_persistent,
+                storage_state_path=storage_state,
+                save_storage_state_path=(
+                    None
+                    if use_persistent
+                    else str(self.session_manager.context_state_path)
+                ),
+            ) as browser:
+                page = browser.get_page()
+                page.set_default_navigation_timeout(DEFAULT_NAVIGATION_TIMEOUT)
+                await browser.navigate(
+                    self.settings.target_url,
+                    timeout=TARGET_NAVIGATION_TIMEOUT,
+                    ready_selector=TARGET_READY_SELECTOR,
+                )
+                await self.filter_manager.configure_all_filters(page)
+                await self.file_saver.save_debug_files(page)
+
+                worker_pages = await self._create_worker_pages(browser, scraper_workers)
+                item_queue: asyncio.Queue[Optional[Dict]] = asyncio.Queue()
 
-        async with BrowserManager(
-            headless=headless_mode,
-            use_persistent_context=use_persistent,
-            storage_state_path=storage_state,
-        ) as browser:
-            page = browser.get_page()
-            await browser.navigate(self.settings.target_url)
-            await self.filter_manager.configure_all_filters(page)
-            await self.file_saver.save_debug_files(page)
-
-            worker_pages = await self._create_worker_pages(page, scraper_workers)
-            item_queue: asyncio.Queue[Optional[Dict]] = asyncio.Queue()
-
-            producer = Producer(self.item_extractor, filters)
-            total_to_process = await producer.run(
-                page, self.settings.target_url, item_queue, limit, scraper_workers
-            )
-
-            scraper_tasks = [
-                self._run_scraper_worker(
-                    i,
-                    item_queue,
-                    storage_queue,
-                    worker_pages[i],
-                    results,
-                    discarded_items,
-                    total_to_process,
+                # BUFF/Steam DNS and TLS setup overlaps the table extraction;
+                # the first worker's BUFF and Steam pages are idle until then
+                warm_up_task = asyncio.create_task(
+                    browser.warm_up_hosts(zip(worker_pages[0], WARM_UP_URLS))
                 )
-                for i in range(scraper_workers)
-            ]
-
-            storage_tasks = []
-            if async_storage and storage_service:
-                storage_tasks = [
-                    StorageWorker(storage_service).run(i, storage_queue)
-                    for i in range(db_workers)
+
+                producer = Producer(self.item_extractor, filters)
+                total_to_process = await producer.run(
+                    page, self.settings.target_url, item_queue, limit, scraper_workers
+                )
+                await asyncio.gather(warm_up_task, rate_task)
+
+                # Every item is queued; the main page is no longer needed, free
+                # its renderer memory for the worker pages
+                await browser.close_page()
+
+                scraper_tasks = [
+                    self._run_scraper_worker(
+                        i,
+                        item_queue,
+                        storage_queue,
+                        worker_pages[i],
+                        results,
+                        discarded_items,
+                        total_to_process,
+                        partial_results_file,
+                    )
+                    for i in range(scraper_workers)
                 ]
 
-            await asyncio.gather(*scraper_tasks)
+                storage_tasks = []
+                if async_storage and storage_service:
+                    storage_tasks = [
+                        StorageWorker(storage_service).run(i, storage_queue)
+                        for i in range(db_workers)
+                    ]
+
+                await asyncio.gather(*scraper_tasks)
+
+                if async_storage and storage_queue:
+                    for _ in range(db_workers):
+                        await storage_queue.put(None)
+                    await asyncio.gather(*storage_tasks)
 
-            if async_storage and storage_queue:
-                for _ in range(db_workers):
-                    await storage_queue.put(None)
-                await asyncio.gather(*storage_tasks)
+                await self._cleanup_worker_pages(worker_pages)
+        finally:
+            if not rate_task.done():
+                # The run failed (e.g. browser start) before the rate was awaited
+                rate_task.cancel()
+            await asyncio.gather(rate_task, return_exceptions=True)
+            await self.detailed_extractor.close_http_client()
 
-            await self._cleanup_worker_pages(worker_pages)
+        self.detailed_extractor.save_cache()
+        if owns_partial_results:
+            self.file_saver.clear_partial_results(partial_results_file)
 
         logger.info(
             "scrape_completed",
@@ -114,12 +168,13 @@ class ScrapingService:
         )
         return results, discarded_items
 
-    async def _create_worker_pages(self, page, count: int):
-        worker_pages = []
-        for _ in range(count):
-            buff_page = await page.context.new_page()
-            steam_page = await page.context.new_page()
-            worker_pages.append((buff_page, steam_page))
+    async def _create_worker_pages(self, browser: BrowserManager, count: int):
+        # Pre-warm every page concurrently in the run's single context; workers
+        # reuse them for all items
+        pages = await asyncio.gather(
+            *(browser.new_page(block_stylesheets=True) for _ in range(count * 2))
+        )
+        worker_pages = list(zip(pages[0::2], pages[1::2]))
         logger.info("worker_pages_ready", count=len(worker_pages))
         return worker_pages
 
@@ -132,10 +187,17 @@ class ScrapingService:
         results,
         discarded_items,
         total_to_process,
+        partial_results_file,
     ):
         buff_page, steam_page = pages
         worker = ScraperWorker(
-            self.settings, self.detailed_extractor, None, buff_page, steam_page
+            self.settings,
+            self.detailed_extractor,
+            None,
+            buff_page,
+            steam_page,
+            file_saver=self.file_saver,
+            partial_results_file=partial_results_file,
         )
         await worker.run(
             worker_id,
@@ -148,7 +210,8 @@ class ScrapingService:
 
     async def _cleanup_worker_pages(self, worker_pages):
         logger.info("closing_worker_pages")
-        for buff_page, steam_page in worker_pages:
-            await buff_page.close()
-            await steam_page.close()
+        await asyncio.gather(
+            *(page.close() for pages in worker_pages for page in pages),
+            return_exceptions=True,
+        )
         logger.info("worker_pages_closed")
@@ -3,5 +3,13 @@
 from .browser_manager import BrowserManager
 from .file_saver import FileSaver
 from .session_manager import SessionManager
+from .cache import ResultCache
+from .rate_limiter import HostRateLimiter
 
-__all__ = ["BrowserManager", "FileSaver", "SessionManager"]
+__all__ = [
+    "BrowserManager",
+    "FileSaver",
+    "SessionManager",
+    "ResultCache",
+    "HostRateLimiter",
+]
@@ -4,19 +4,45 @@ Handles browser initialization and configuration.
 Supports both persistent context (local) and storage_state (CI/manual sessions).
 """
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from typing import Optional
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    Route,
+)
+from typing import Iterable, Optional, Tuple
+import asyncio
 import os
 import json
 from pathlib import Path
 
+from app.core.constants import (
+    BLOCKED_RESOURCE_TYPES,
+    BLOCKED_URL_KEYWORDS,
+    FILTER_MODAL_APPEAR_TIMEOUT,
+    FILTER_MODAL_HIDE_TIMEOUT,
+    WARM_UP_TIMEOUT,
+    WORKER_BLOCKED_RESOURCE_TYPES,
+)
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class BrowserManager:
-    """Manages creation and configuration of Playwright browser."""
+    """Manages creation and configuration of Playwright browser.
+
+    The Playwright driver and the launched browser are shared at class level,
+    so consecutive runs only pay for a new context. Call shutdown() once at
+    the end of the program to release them.
+    """
+
+    _shared_playwright = None
+    _shared_browser: Optional[Browser] = None
+    _shared_headless: Optional[bool] = None
+    _shared_loop: Optional[asyncio.AbstractEventLoop] = None
+    _shared_lock: Optional[asyncio.Lock] = None
 
     def __init__(
         self,
@@ -24,6 +50,8 @@ class BrowserManager:
         profile_dir: Optional[str] = None,
         storage_state_path: Optional[str] = None,
         use_persistent_context: bool = True,
+        block_resources: bool = True,
+        save_storage_state_path: Optional[str] = None,
     ):
         self.headless = headless
         self.profile_dir = profile_dir or os.path.join(
@@ -31,10 +59,16 @@ class BrowserManager:
         )
         self.storage_state_path = storage_state_path
         self.use_persistent_context = use_persistent_context
+        self.block_resources = block_resources
+        self.save_storage_state_path = save_storage_state_path
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # Every page of a run should come from one context; counted so a
+        # context-per-page regression shows up in the logs
+        self.context_creations = 0
+        self.pages_created = 0
 
     async def __aenter__(self):
         await self.start()
@@ -43,6 +77,75 @@ class BrowserManager:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
+    @classmethod
+    def _shared_init_lock(cls) -> asyncio.Lock:
+        """Return the lock guarding the shared objects of the running loop."""
+        loop = asyncio.get_running_loop()
+        if cls._shared_loop is not loop:
+            # Objects bound to a previous (closed) loop cannot be reused. No
+            # await happens here, so the reset is atomic for this loop
+            cls._shared_playwright = None
+            cls._shared_browser = None
+            cls._shared_loop = loop
+            cls._shared_lock = asyncio.Lock()
+        return cls._shared_lock
+
+    @classmethod
+    async def get_playwright(cls):
+        """Start the Playwright driver once per event loop and reuse it."""
+        async with cls._shared_init_lock():
+            return await cls._ensure_playwright()
+
+    @classmethod
+    async def _ensure_playwright(cls):
+        # Caller must hold the shared init lock
+        if cls._shared_playwright is None:
+            cls._shared_playwright = await async_playwright().start()
+        return cls._shared_playwright
+
+    @classmethod
+    async def get_browser(cls, headless: bool) -> Browser:
+        """Launch Chrome once and reuse it while headless mode matches."""
+        async with cls._shared_init_lock():
+            playwright = await cls._ensure_playwright()
+            browser = cls._shared_browser
+
+            if browser and (
+                not browser.is_connected() or cls._shared_headless != headless
+            ):
+                if browser.is_connected():
+                    await browser.close()
+                browser = None
+
+            if browser is None:
+                browser = await playwright.chromium.launch(
+                    headless=headless,
+                    channel="chrome",
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-dev-shm-usage",
+                    ],
+                )
+                cls._shared_browser = browser
+                cls._shared_headless = headless
+                logger.info("shared_browser_launched", headless=headless)
+
+            return browser
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared browser and stop the Playwright driver."""
+        async with cls._shared_init_lock():
+            if cls._shared_browser:
+                if cls._shared_browser.is_connected():
+                    await cls._shared_browser.close()
+                cls._shared_browser = None
+            if cls._shared_playwright:
+                await cls._shared_playwright.stop()
+                cls._shared_playwright = None
+        cls._shared_loop = None
+        logger.info("shared_browser_shutdown")
+
     async def start(self):
         """Start browser with persistent context or storage state."""
         logger.info(
@@ -50,7 +153,7 @@ class BrowserManager:
             mode="persistent" if self.use_persistent_context else "storage_state",
         )
 
-        self.playwright = await async_playwright().start()
+        self.playwright = await self.get_playwright()
 
         if self.use_persistent_context:
             # Use persistent profile in user directory
@@ -69,21 +172,16 @@ class BrowserManager:
                 ignore_default_args=["--enable-automation"],
             )
 
+            self.context_creations += 1
+
             # Persistent context comes with pages, use first or create new
             if len(self.context.pages) > 0:
                 self.page = self.context.pages[0]
             else:
-                self.page = await self.context.new_page()
+                self.page = await self.new_page()
         else:
-            # Use regular browser with storage_state for CI/manual sessions
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                channel="chrome",
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                ],
-            )
+            # Use shared browser with storage_state for CI/manual sessions
+            self.browser = await self.get_browser(self.headless)
 
             # Load storage state if available
             context_options = {
@@ -97,10 +195,14 @@ class BrowserManager:
                 logger.info("loading_storage_state", path=self.storage_state_path)
 
             self.context = await self.browser.new_context(**context_options)
-            self.page = await self.context.new_page()
+            self.context_creations += 1
+            self.page = await self.new_page()
+
+        if self.block_resources:
+            await self.context.route("**/*", self._block_unneeded_requests)
 
-        # Hide webdriver property
-        await self.page.add_init_script(
+        # Hide webdriver property on every page of the context
+        await self.context.add_init_script(
             """
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
@@ -113,15 +215,85 @@ class BrowserManager:
             profile_path=self.profile_dir if self.use_persistent_context else None,
         )
 
+    @staticmethod
+    async def _block_unneeded_requests(route: Route):
+        """Abort images, media, fonts and analytics; continue everything else."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            keyword in request.url for keyword in BLOCKED_URL_KEYWORDS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    async def _block_worker_requests(route: Route):
+        """Like _block_unneeded_requests, but stylesheets are dropped too."""
+        if route.request.resource_type in WORKER_BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await BrowserManager._block_unneeded_requests(route)
+
+    async def new_page(self, block_stylesheets: bool = False) -> Page:
+        """Open another page in this run's context.
+
+        block_stylesheets is meant for extraction-only pages: the SteamDT page
+        keeps its CSS because the filter setup relies on visibility checks.
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started. Call start() first.")
+        self.pages_created += 1
+        page = await self.context.new_page()
+        if block_stylesheets and self.block_resources:
+            # Page routes take precedence over the context route
+            await page.route("**/*", self._block_worker_requests)
+        return page
+
+    async def warm_up_hosts(self, page_urls: Iterable[Tuple[Page, str]]):
+        """Resolve and connect to hosts ahead of the first item.
+
+        Each URL is opened as a top-level navigation on an idle worker page,
+        so Chromium's own DNS cache and socket pool (partitioned by top-level
+        site) hold the connection the worker navigations to that host reuse.
+        Failures only mean the first item pays for the setup itself.
+        """
+        results = await asyncio.gather(
+            *(
+                page.goto(url, wait_until="commit", timeout=WARM_UP_TIMEOUT)
+                for page, url in page_urls
+            ),
+            return_exceptions=True,
+        )
+        failed = sum(isinstance(result, Exception) for result in results)
+        logger.debug("hosts_warmed_up", hosts=len(results), failed=failed)
+
     async def close(self):
-        """Close browser and cleanup."""
+        """Close this run's context; the shared browser stays alive."""
+        logger.debug(
+            "browser_context_stats",
+            context_creations=self.context_creations,
+            pages_created=self.pages_created,
+        )
+        if self.context_creations > 1:
+            logger.warning(
+                "multiple_browser_contexts_created", count=self.context_creations
+            )
+        if self.context and self.save_storage_state_path:
+            try:
+                await self.save_storage_state(self.save_storage_state_path)
+            except Exception as e:
+                logger.warning("storage_state_save_failed", error=str(e))
         if self.context:
             await self.context.close()
+            self.context = None
+            self.page = None
             logger.info("browser_closed")
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+
+    async def close_page(self):
+        """Close the main page early, keeping the context for worker pages."""
+        if self.page and not self.page.is_closed():
+            await self.page.close()
+        self.page = None
 
     async def save_storage_state(self, path: str):
         """Save current storage state (cookies, local storage) to file."""
@@ -134,13 +306,21 @@ class BrowserManager:
         await self.context.storage_state(path=path)
         logger.info("storage_state_saved", path=path)
 
-    async def navigate(self, url: str, timeout: int = 60000):
-        """Navigate to URL."""
+    async def navigate(
+        self, url: str, timeout: int = 60000, ready_selector: Optional[str] = None
+    ):
+        """Navigate to URL.
+
+        Waits for DOMContentLoaded and, if given, for ready_selector to appear
+        instead of waiting for the network to go idle.
+        """
         if not self.page:
             raise RuntimeError("Browser not started. Call start() first.")
 
         logger.info("navigating_to_url", url=url)
-        await self.page.goto(url, wait_until="networkidle", timeout=timeout)
+        await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        if ready_selector:
+            await self.page.wait_for_selector(ready_selector, timeout=timeout)
         logger.info("page_loaded")
 
     async def wait(self, milliseconds: int):
@@ -157,11 +337,15 @@ class BrowserManager:
 
         try:
             # Look for close button (Chinese text)
-            close_button = self.page.locator('button:has-text("我已知晓")')
-            if await close_button.count() > 0:
-                await close_button.first.click()
-                logger.info("modal_closed")
-                await self.wait(1000)
+            close_button = self.page.locator('button:has-text("我已知晓")').first
+            await close_button.wait_for(
+                state="visible", timeout=FILTER_MODAL_APPEAR_TIMEOUT
+            )
+            await close_button.click()
+            await close_button.wait_for(
+                state="hidden", timeout=FILTER_MODAL_HIDE_TIMEOUT
+            )
+            logger.info("modal_closed")
         except Exception as e:
             logger.debug("modal_not_found_or_already_closed", error=str(e))
 
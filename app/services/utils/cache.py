@@ -0,0 +1,87 @@
+"""
+Small TTL cache kept in memory and persisted as a JSON file.
+Used to skip repeated navigations for items already scraped recently.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from app.core.logger import get_logger
+from app.services.utils.file_saver import write_json
+
+logger = get_logger(__name__)
+
+
+class ResultCache:
+    """LRU cache with per-entry expiry, loaded from and saved to a JSON file."""
+
+    def __init__(self, path: Path, ttl_seconds: float, max_entries: int = 2048):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load non-expired entries from disk."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("cache_load_failed", path=str(self.path), error=str(e))
+            return
+
+        now = time.time()
+        entries = OrderedDict()
+        try:
+            for key, (expires_at, value) in data.items():
+                if expires_at > now:
+                    entries[key] = (expires_at, value)
+        except (AttributeError, TypeError, ValueError, KeyError) as e:
+            # Valid JSON with the wrong shape: start with an empty cache
+            logger.warning("cache_load_failed", path=str(self.path), error=str(e))
+            return
+        self._entries = entries
+
+        logger.info("cache_loaded", path=str(self.path), entries=len(self._entries))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._dirty = True
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store value with the configured TTL, evicting the oldest entries."""
+        self._entries[key] = (time.time() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def save(self):
+        """Persist entries to disk if anything changed."""
+        if not self._dirty:
+            return
+
+        os.makedirs(self.path.parent, exist_ok=True)
+        write_json(str(self.path), dict(self._entries), indent=False)
+        self._dirty = False
+        logger.info("cache_saved", path=str(self.path), entries=len(self._entries))
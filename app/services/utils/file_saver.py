@@ -3,17 +3,103 @@ File saving utilities for scraper.
 Handles JSON, HTML, screenshots and debug data.
 """
 
+import asyncio
 import json
 import os
-from typing import List
+import tempfile
+import uuid
+from contextlib import contextmanager
+from typing import IO, Any, Iterable, Iterator, List, Union
 from playwright.async_api import Page
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
 from app.core.logger import get_logger
 from app.core.config import Settings
+from app.core.constants import SCREENSHOT_JPEG_QUALITY
 from app.domain.models import ScrapedItem
 
 logger = get_logger(__name__)
 
+PARTIAL_RESULTS_FILE = "partial_results.jsonl"
+
+
+@contextmanager
+def _atomic_open(path: str, mode: str = "wb", **kwargs) -> Iterator[IO]:
+    """Open a temp file next to path and move it into place once closed.
+
+    Readers never see a half-written file, and a failed write leaves the
+    previous version untouched.
+    """
+    # Unique per call, so overlapping writers to one path don't share a file
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f"{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+    try:
+        # mkstemp creates the file owner-only; keep the usual permissions
+        os.chmod(tmp_path, 0o644)
+        with open(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json(path: str, data: Any, indent: bool = True):
+    """Write data as UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        # NON_STR_KEYS keeps parity with stdlib json, which coerces int keys
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with _atomic_open(path) as f:
+            f.write(orjson.dumps(data, option=option, default=str))
+        return
+
+    with _atomic_open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            data, f, ensure_ascii=False, indent=2 if indent else None, default=str
+        )
+
+
+def write_json_array(path: str, records: Iterable[Any]):
+    """Write records as an indented JSON array, encoding one record at a time.
+
+    Produces the same output as write_json(path, list(records)) without ever
+    holding the whole encoded array in memory.
+    """
+    with _atomic_open(path) as f:
+        first = True
+        for record in records:
+            if orjson is not None:
+                encoded = orjson.dumps(
+                    record,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+                    default=str,
+                )
+            else:
+                encoded = json.dumps(
+                    record, ensure_ascii=False, indent=2, default=str
+                ).encode("utf-8")
+            # Nest the record one level deeper inside the array
+            f.write(b"[\n  " if first else b",\n  ")
+            f.write(encoded.replace(b"\n", b"\n  "))
+            first = False
+        f.write(b"[]" if first else b"\n]")
+
+
+def _write_text(path: str, content: str):
+    """Write content as a UTF-8 text file."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
 
 class FileSaver:
     """Manages file saving for scraper."""
@@ -27,18 +113,45 @@ class FileSaver:
 
     def save_json(self, data: List[ScrapedItem], filename: str = "scraped_data.json"):
         """Save scraped data as JSON."""
-        # Ensure path includes directory
-        if not filename.startswith(self.output_dir):
-            filename = os.path.join(self.output_dir, os.path.basename(filename))
-
-        # Convert Pydantic models to dict
-        data_dicts = [item.model_dump() for item in data]
+        # Always write inside the output directory
+        filename = os.path.join(self.output_dir, os.path.basename(filename))
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data_dicts, f, ensure_ascii=False, indent=2, default=str)
+        # Convert Pydantic models to dict one at a time while streaming
+        write_json_array(filename, (item.model_dump() for item in data))
 
         logger.info("data_saved_to_file", filename=filename, items=len(data))
 
+    def append_jsonl(
+        self, record: Union[dict, ScrapedItem], filename: str = PARTIAL_RESULTS_FILE
+    ):
+        """Append one record as a JSON line so partial results survive crashes."""
+        path = os.path.join(self.output_dir, filename)
+        if isinstance(record, ScrapedItem):
+            # Serialized by pydantic-core directly, no intermediate dict
+            line = record.model_dump_json().encode("utf-8") + b"\n"
+        elif orjson is not None:
+            line = orjson.dumps(record, default=str) + b"\n"
+        else:
+            line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            line = line.encode("utf-8")
+
+        with open(path, "ab") as f:
+            f.write(line)
+
+    def new_partial_results_file(self) -> str:
+        """Return a partial results file name unique to one run.
+
+        Concurrent runs share output_dir, so each one appends to its own file.
+        """
+        stem, ext = os.path.splitext(PARTIAL_RESULTS_FILE)
+        return f"{stem}_{uuid.uuid4().hex[:12]}{ext}"
+
+    def clear_partial_results(self, filename: str = PARTIAL_RESULTS_FILE):
+        """Remove the partial results file, if any."""
+        path = os.path.join(self.output_dir, filename)
+        if os.path.exists(path):
+            os.remove(path)
+
     async def save_debug_files(self, page: Page):
         """Save debug files (screenshot and HTML)."""
         if not self.settings.save_debug_info:
@@ -53,11 +166,32 @@ class FileSaver:
             await self.save_html(page, "page_content.html")
         """
 
-    async def save_screenshot(self, page: Page, filename: str = "screenshot.png"):
-        """Save page screenshot."""
+    async def save_empty_result_snapshot(self, page: Page):
+        """Save HTML (and screenshot) only when extraction found no items."""
+        if not (self.settings.save_debug_info and self.settings.save_html):
+            return
+
+        # Independent page round-trips, so run them concurrently
+        tasks = [self.save_html(page, "no_items_snapshot.html")]
+        if self.settings.save_screenshot:
+            tasks.append(self.save_screenshot(page, "no_items_snapshot"))
+
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning("snapshot_save_error", error=str(result))
+
+    async def save_screenshot(self, page: Page, filename: str = "screenshot"):
+        """Save page screenshot in the configured format (extension is set here)."""
         try:
-            screenshot_path = os.path.join(self.output_dir, filename)
-            await page.screenshot(path=screenshot_path)
+            base_name = os.path.splitext(filename)[0]
+            if self.settings.screenshot_format == "jpeg":
+                screenshot_path = os.path.join(self.output_dir, f"{base_name}.jpg")
+                await page.screenshot(
+                    path=screenshot_path, type="jpeg", quality=SCREENSHOT_JPEG_QUALITY
+                )
+            else:
+                screenshot_path = os.path.join(self.output_dir, f"{base_name}.png")
+                await page.screenshot(path=screenshot_path, type="png")
             logger.info("screenshot_saved", path=screenshot_path)
         except Exception as e:
             logger.warning("screenshot_save_error", error=str(e))
@@ -68,8 +202,8 @@ class FileSaver:
             html_path = os.path.join(self.output_dir, filename)
             content = await page.content()
 
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Off the event loop so a large page doesn't stall other workers
+            await asyncio.to_thread(_write_text, html_path, content)
 
             logger.info("html_saved", path=html_path)
         except Exception as e:
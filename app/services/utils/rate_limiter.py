@@ -0,0 +1,71 @@
+"""
+Per-host request pacing shared by all workers.
+Keeps concurrent workers under each market's rate limit.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+from app.core.constants import (
+    AUTOTHROTTLE_MAX_INTERVAL,
+    AUTOTHROTTLE_TARGET_CONCURRENCY,
+)
+
+
+class HostRateLimiter:
+    """Spaces requests to each configured host, adapting to its latency.
+
+    Every call reserves the next free slot for its host before sleeping, so
+    concurrent callers queue up in order instead of waking up together.
+    The configured rate is a ceiling: when a host slows down, the spacing
+    grows towards latency / AUTOTHROTTLE_TARGET_CONCURRENCY (AutoThrottle
+    style) and shrinks back as it recovers. Hosts without a configured rate
+    are never delayed.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        # Minimum seconds between two requests to the same host
+        self._min_intervals = {
+            host: 1.0 / rate for host, rate in rates.items() if rate > 0
+        }
+        self._intervals = dict(self._min_intervals)
+        self._next_slot: Dict[str, float] = {}
+
+    async def acquire(self, url: str):
+        """Wait until a request to url's host is allowed."""
+        host = urlsplit(url).hostname
+        interval: Optional[float] = self._intervals.get(host) if host else None
+        if interval is None:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def record_latency(self, url: str, seconds: float):
+        """Move the host's spacing halfway towards what its latency suggests."""
+        host = urlsplit(url).hostname
+        interval = self._intervals.get(host) if host else None
+        if interval is None:
+            return
+
+        target = seconds / AUTOTHROTTLE_TARGET_CONCURRENCY
+        self._intervals[host] = min(
+            max((interval + target) / 2, self._min_intervals[host]),
+            AUTOTHROTTLE_MAX_INTERVAL,
+        )
+
+    @asynccontextmanager
+    async def throttle(self, url: str) -> AsyncIterator[None]:
+        """Acquire a slot for url, then time the request made inside."""
+        await self.acquire(url)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            yield
+        finally:
+            self.record_latency(url, loop.time() - started)
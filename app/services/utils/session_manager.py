@@ -17,6 +17,8 @@ class SessionManager:
         self.buff_session_path = sessions_dir / "buff_session.json"
         self.steam_session_path = sessions_dir / "steam_session.json"
         self.merged_session_path = sessions_dir / "merged_session.json"
+        # Context state saved at the end of each run (consent cookies, storage)
+        self.context_state_path = sessions_dir / "context_state.json"
 
     def has_sessions(self) -> bool:
         return self.buff_session_path.exists() or self.steam_session_path.exists()
@@ -36,6 +38,17 @@ class SessionManager:
     def _merge_sessions(self) -> dict:
         merged_state = {"cookies": [], "origins": []}
 
+        # Previous run state goes first so fresh BUFF/Steam sessions win
+        if self.context_state_path.exists():
+            with open(self.context_state_path, "r", encoding="utf-8") as f:
+                context_data = json.load(f)
+                merged_state["cookies"].extend(context_data.get("cookies", []))
+                merged_state["origins"].extend(context_data.get("origins", []))
+                logger.info(
+                    "loaded_context_state",
+                    cookies=len(context_data.get("cookies", [])),
+                )
+
         if self.buff_session_path.exists():
             with open(self.buff_session_path, "r", encoding="utf-8") as f:
                 buff_data = json.load(f)
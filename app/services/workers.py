@@ -11,6 +11,8 @@ from app.core.logger import get_logger
 from app.domain.models import ScrapedItem
 from app.services.extractors import DetailedItemExtractor
 from app.services.storage import StorageService
+from app.services.utils import FileSaver
+from app.services.utils.file_saver import PARTIAL_RESULTS_FILE
 
 logger = get_logger(__name__)
 
@@ -52,6 +54,33 @@ class Producer:
         if excluded > 0:
             logger.info("exclusion_filters_applied", excluded=excluded)
 
+        # Items without any URL cannot be scraped; skip them before they cost a
+        # worker slot and its anti-ban delay
+        with_urls = [
+            item
+            for item in filtered_items
+            if item.get("url") or (item.get("buff_url") and item.get("steam_url"))
+        ]
+        if len(with_urls) < len(filtered_items):
+            logger.warning(
+                "items_without_url_skipped",
+                skipped=len(filtered_items) - len(with_urls),
+            )
+
+        # The table can list the same item twice; keep the first occurrence so
+        # each item costs a single detailed navigation
+        unique_items: Dict = {}
+        for item in with_urls:
+            key = item.get("url") or (item["buff_url"], item["steam_url"])
+            unique_items.setdefault(key, item)
+        if len(unique_items) < len(with_urls):
+            logger.info(
+                "duplicate_items_skipped",
+                before=len(with_urls),
+                after=len(unique_items),
+            )
+        filtered_items = list(unique_items.values())
+
         for item in filtered_items:
             await item_queue.put(item)
 
@@ -72,12 +101,19 @@ class ScraperWorker:
         page,
         buff_page,
         steam_page,
+        file_saver: Optional[FileSaver] = None,
+        partial_results_file: str = PARTIAL_RESULTS_FILE,
     ):
         self.settings = settings
+        # Delay bounds are fixed for the run, resolve them once
+        self.delay_between_items = settings.delay_between_items
+        self.random_delay_range = (settings.random_delay_min, settings.random_delay_max)
         self.detailed_extractor = detailed_extractor
         self.page = page
         self.buff_page = buff_page
         self.steam_page = steam_page
+        self.file_saver = file_saver
+        self.partial_results_file = partial_results_file
 
     async def run(
         self,
@@ -98,7 +134,7 @@ class ScraperWorker:
                 break
 
             try:
-                logger.info(
+                logger.debug(
                     "worker_processing_item",
                     worker_id=worker_id,
                     item=item["item_name"],
@@ -113,13 +149,13 @@ class ScraperWorker:
                 )
 
                 if detailed_data:
+                    display_name = format_item_display(
+                        item["item_name"],
+                        detailed_data.get("quality"),
+                        detailed_data.get("stattrak", False),
+                    )
                     if detailed_data.get("discarded"):
                         discarded_items.append(detailed_data)
-                        display_name = format_item_display(
-                            item["item_name"],
-                            detailed_data.get("quality"),
-                            detailed_data.get("stattrak", False),
-                        )
                         logger.info(
                             "item_discarded",
                             worker_id=worker_id,
@@ -133,22 +169,28 @@ class ScraperWorker:
                         results.append(scraped_item)
                         processed += 1
 
+                        if self.file_saver:
+                            self.file_saver.append_jsonl(
+                                scraped_item, self.partial_results_file
+                            )
+
                         if storage_queue:
                             await storage_queue.put(scraped_item)
 
-                        display_name = format_item_display(
-                            item["item_name"],
-                            detailed_data.get("quality"),
-                            detailed_data.get("stattrak", False),
-                        )
                         logger.info(
                             "item_scraped",
                             worker_id=worker_id,
-                            progress=f"{processed}/{total_to_process}",
+                            processed=processed,
+                            total=total_to_process,
                             item=display_name,
-                            buff=f"€{detailed_data['buff_avg_price_eur']:.2f}",
-                            steam=f"€{detailed_data['steam_avg_price_eur']:.2f}",
-                            roi=f"{detailed_data['profitability_ratio']:.1%}",
+                            buff_eur=detailed_data["buff_avg_price_eur"],
+                            steam_eur=detailed_data["steam_avg_price_eur"],
+                            profit_eur=detailed_data["profit_eur"],
+                            buff_volume=detailed_data["buff_volume"],
+                            steam_volume=detailed_data["steam_volume"],
+                            roi_percent=round(
+                                detailed_data["profitability_percent"], 1
+                            ),
                         )
 
                 await self._apply_delay()
@@ -166,11 +208,9 @@ class ScraperWorker:
         logger.info("consumer_finished", worker_id=worker_id, processed=processed)
 
     async def _apply_delay(self):
-        delay = self.settings.delay_between_items
-        random_delay = random.randint(
-            self.settings.random_delay_min, self.settings.random_delay_max
+        total_delay_ms = self.delay_between_items + random.randint(
+            *self.random_delay_range
         )
-        total_delay_ms = delay + random_delay
         await asyncio.sleep(total_delay_ms / 1000)
 
 
@@ -30,7 +30,9 @@ async def save_buff_session(headless: bool = False):
     logger.info("starting_buff_login", headless=headless)
 
     async with BrowserManager(
-        headless=headless, use_persistent_context=False  # Use storage_state mode
+        headless=headless,
+        use_persistent_context=False,  # Use storage_state mode
+        block_resources=False,  # Login pages need images (captcha, QR code)
     ) as browser:
         page = browser.get_page()
 
@@ -58,7 +60,9 @@ async def save_steam_session(headless: bool = False):
     logger.info("starting_steam_login", headless=headless)
 
     async with BrowserManager(
-        headless=headless, use_persistent_context=False  # Use storage_state mode
+        headless=headless,
+        use_persistent_context=False,  # Use storage_state mode
+        block_resources=False,  # Login pages need images (captcha, QR code)
     ) as browser:
         page = browser.get_page()
 
@@ -194,5 +198,13 @@ async def main():
         raise
 
 
+async def run():
+    """Run main and release the shared browser afterwards."""
+    try:
+        await main()
+    finally:
+        await BrowserManager.shutdown()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())